@@ -91,10 +91,8 @@ class utils:
 
     @staticmethod
     def raw_state_to_dec(rx: Iterable[int]) -> str:
-        raw_state_str = ""
-        for _r in rx:
-            raw_state_str += str(_r) + ","
-        return raw_state_str
+        raw_state_str = ",".join(map(str, rx))
+        return f"{raw_state_str}," if raw_state_str else raw_state_str
 
     max_delay = 0x1F
 
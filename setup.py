@@ -13,6 +13,7 @@ test_requirements = [
     "pytest>=5.4.3",
     "pytest-cov>=2.9.0",
     "pytest-raises>=0.11",
+    "pytest-xdist>=3.0.0",
 ]
 
 dev_requirements = [
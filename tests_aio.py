@@ -7,7 +7,7 @@ import json
 import logging
 import time
 import sys
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import call, patch
 
 try:
     from unittest.mock import AsyncMock
@@ -58,16 +58,6 @@ MODEL = "AZ120444"
 MODEL_DESCRIPTION = "Bulb RGBCW"
 FLUX_MAC_ADDRESS = "aabbccddeeff"
 
-FLUX_DISCOVERY_PARTIAL = FluxLEDDiscovery(
-    ipaddr=IP_ADDRESS,
-    model=MODEL,
-    id=FLUX_MAC_ADDRESS,
-    model_num=None,
-    version_num=None,
-    firmware_date=None,
-    model_info=None,
-    model_description=None,
-)
 FLUX_DISCOVERY = FluxLEDDiscovery(
     ipaddr=IP_ADDRESS,
     model=MODEL,
@@ -78,36 +68,103 @@ FLUX_DISCOVERY = FluxLEDDiscovery(
     model_info=MODEL,
     model_description=MODEL_DESCRIPTION,
 )
+FLUX_DISCOVERY_PARTIAL = FluxLEDDiscovery(
+    {
+        **FLUX_DISCOVERY,
+        "model_num": None,
+        "version_num": None,
+        "firmware_date": None,
+        "model_info": None,
+        "model_description": None,
+    }
+)
 FLUX_DISCOVERY_24G_REMOTE = FluxLEDDiscovery(
-    ipaddr=IP_ADDRESS,
-    model="AK001-ZJ2148",
-    id=FLUX_MAC_ADDRESS,
-    model_num=0x25,
-    version_num=0x04,
-    firmware_date=datetime.date(2021, 5, 5),
-    model_info=MODEL,
-    model_description=MODEL_DESCRIPTION,
+    {**FLUX_DISCOVERY, "model": "AK001-ZJ2148"}
 )
 FLUX_DISCOVERY_LEGACY = FluxLEDDiscovery(
-    ipaddr=IP_ADDRESS,
-    model=MODEL,
-    id="ACCF23123456",
-    model_num=0x23,
-    version_num=0x04,
-    firmware_date=datetime.date(2021, 5, 5),
-    model_info=MODEL,
-    model_description=MODEL_DESCRIPTION,
+    {**FLUX_DISCOVERY, "id": "ACCF23123456", "model_num": 0x23}
 )
-FLUX_DISCOVERY_MISSING_HARDWARE = FluxLEDDiscovery(
-    ipaddr=IP_ADDRESS,
-    model=None,
-    id=FLUX_MAC_ADDRESS,
-    model_num=0x25,
-    version_num=0x04,
-    firmware_date=datetime.date(2021, 5, 5),
-    model_info=MODEL,
-    model_description=MODEL_DESCRIPTION,
+FLUX_DISCOVERY_MISSING_HARDWARE = FluxLEDDiscovery({**FLUX_DISCOVERY, "model": None})
+
+
+FLUX_DISCOVERY_MIC = FluxLEDDiscovery(
+    {
+        "firmware_date": datetime.date(2021, 2, 4),
+        "id": "B4E842E10588",
+        "ipaddr": "192.168.213.252",
+        "model": "AK001-ZJ2145",
+        "model_description": "Controller RGB with MIC",
+        "model_info": "ZG-BL",
+        "model_num": 8,
+        "remote_access_enabled": True,
+        "remote_access_host": "ra8816us02.magichue.net",
+        "remote_access_port": 8816,
+        "version_num": 21,
+    }
+)
+SCAN_RESPONSE_MIC = b"192.168.213.252,B4E842E10588,AK001-ZJ2145"
+VERSION_RESPONSE_MIC = b"+ok=08_15_20210204_ZG-BL\r"
+REMOTE_ACCESS_RESPONSE = b"+ok=TCP,8816,ra8816us02.magichue.net\r"
+
+
+def _with_checksum(data: bytes) -> bytes:
+    """Append the LEDENET checksum to a frame."""
+    return data + bytes([sum(data) & 0xFF])
+
+
+STATE_0X25_ON = _with_checksum(b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f")
+STATE_0X25_OFF = _with_checksum(b"\x81\x25\x24\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f")
+STATE_0XA3 = _with_checksum(b"\x81\xa3#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0")
+STATE_0X08_MUSIC = _with_checksum(
+    b"\x81\x08\x23\x5d\x01\x10\x64\x00\x00\x00\x04\x00\xf0"
 )
+STATE_0X06_OFF = _with_checksum(b"\x81\x06\x24\x61\x24\x01\x00\xff\x00\x00\x03\x00\xf0")
+STATE_0X1A_ON = _with_checksum(b"\x81\x1a\x23\x61\x00\x00\x00\xff\x00\x00\x01\x00\x06")
+STATE_0X1C_ON = _with_checksum(b"\x81\x1c\x23\x61\x00\x05\x00\x64\x64\x64\x03\x64\x0f")
+STATE_0X1C_OFF = _with_checksum(b"\x81\x1c\x24\x61\x00\x05\x00\x64\x64\x64\x03\x64\x0f")
+IC_STATE = _with_checksum(b"\x00\x63\x00\x19\x00\x02\x04\x03\x19\x02")
+STATE_0X97_ON = _with_checksum(b"\x81\x97\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f")
+STATE_0X97_OFF = _with_checksum(b"\x81\x97\x24\x24\x00\x00\x00\x00\x00\x00\x02\x00\x00")
+IC_STATE_SK6812RGBW = b"\xb0\xb1\xb2\xb3\x00\x01\x01\x00\x00\x0b\x00\x63\x00\x90\x00\x01\x07\x08\x90\x01\x94\xfb"
+REMOTE_CONFIG_DISABLED = b"\xb0\xb1\xb2\xb3\x00\x01\x01\x5e\x00\x0e\x2b\x01\x00\x00\x00\x00\x29\x00\x00\x00\x00\x00\x00\x55\xde"
+REMOTE_CONFIG_PAIRED_ONLY = b"\xb0\xb1\xb2\xb3\x00\x01\x01\xe3\x00\x0e\x2b\x03\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x19"
+POWER_ON_RESPONSE = _with_checksum(b"\x0f\x71\x23")
+POWER_OFF_RESPONSE = _with_checksum(b"\x0f\x71\x24")
+OUTER_MESSAGE_PREFIX = b"\xb0\xb1\xb2\xb3\x00"
+RGB_WIRINGS = ["RGB", "GRB", "BRG"]
+ADDRESSABLE_RGB_WIRINGS = ["RGB", "RBG", "GRB", "GBR", "BRG", "BGR"]
+
+
+class MockTransport:
+    """Record the calls made on a transport like MagicMock does.
+
+    Only the transport methods used by the protocols are implemented, and
+    the calls are stored in mock_calls so tests can compare them to call.*.
+    """
+
+    __slots__ = ("mock_calls",)
+
+    def __init__(self) -> None:
+        self.mock_calls: list = []
+
+    def reset_mock(self) -> None:
+        self.mock_calls.clear()
+
+    def get_extra_info(self, name, default=None):
+        self.mock_calls.append(call.get_extra_info(name))
+        return default
+
+    def write(self, data) -> None:
+        self.mock_calls.append(call.write(data))
+
+    def write_eof(self) -> None:
+        self.mock_calls.append(call.write_eof())
+
+    def sendto(self, data, addr=None) -> None:
+        self.mock_calls.append(call.sendto(data, addr))
+
+    def close(self) -> None:
+        self.mock_calls.append(call.close())
 
 
 class MinJSONEncoder(json.JSONEncoder):
@@ -117,31 +174,31 @@ class MinJSONEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, o)
 
 
-def mock_coro(return_value=None, exception=None):
+def _noop_callback(*args, **kwargs):
+    """Ignore state updates."""
+
+
+async def mock_coro(return_value=None, exception=None):
     """Return a coro that returns a value or raise an exception."""
-    fut = asyncio.Future()
     if exception is not None:
-        fut.set_exception(exception)
-    else:
-        fut.set_result(return_value)
-    return fut
+        raise exception
+    return return_value
 
 
 @pytest.fixture
 async def mock_discovery_aio_protocol():
     """Fixture to mock an asyncio connection."""
     loop = asyncio.get_running_loop()
-    future = asyncio.Future()
+    future = loop.create_future()
 
     async def _wait_for_connection():
         transport, protocol = await future
         await asyncio.sleep(0)
-        await asyncio.sleep(0)
         return transport, protocol
 
     async def _mock_create_datagram_endpoint(func, sock=None):
         protocol: LEDENETDiscovery = func()
-        transport = MagicMock()
+        transport = MockTransport()
         protocol.connection_made(transport)
         with contextlib.suppress(asyncio.InvalidStateError):
             future.set_result((transport, protocol))
@@ -158,18 +215,16 @@ async def mock_discovery_aio_protocol():
 async def mock_aio_protocol():
     """Fixture to mock an asyncio connection."""
     loop = asyncio.get_running_loop()
-    future = asyncio.Future()
+    future = loop.create_future()
 
     async def _wait_for_connection():
         transport, protocol = await future
         await asyncio.sleep(0)
-        await asyncio.sleep(0)
-        await asyncio.sleep(0)
         return transport, protocol
 
     async def _mock_create_connection(func, ip, port):
         protocol: AIOLEDENETProtocol = func()
-        transport = MagicMock()
+        transport = MockTransport()
         protocol.connection_made(transport)
         with contextlib.suppress(asyncio.InvalidStateError):
             future.set_result((transport, protocol))
@@ -179,23 +234,57 @@ async def mock_aio_protocol():
         yield _wait_for_connection
 
 
-@pytest.mark.asyncio
+@pytest.fixture
+def no_device_config_wait():
+    """Fixture to skip waiting for the device to apply a config change."""
+    with patch.object(aiodevice, "DEVICE_CONFIG_WAIT_SECONDS", 0):
+        yield
+
+
+@pytest.fixture
+def no_command_spacing_delay():
+    """Fixture to skip waiting between commands sent back to back."""
+    with patch.object(aiodevice, "COMMAND_SPACING_DELAY", 0):
+        yield
+
+
+@pytest.fixture
+def no_device_config_resync():
+    """Fixture to skip re-reading the device config after changing it."""
+    with patch.object(AIOWifiLedBulb, "_async_device_config_resync", mock_coro):
+        yield
+
+
+@pytest.fixture
+async def ready_light(request, mock_aio_protocol):
+    """Fixture for an AIOWifiLedBulb that has completed setup.
+
+    The initial state response defaults to a 0x25 RGBWW controller and can
+    be overridden with indirect parametrization.
+    """
+    state = getattr(request, "param", STATE_0X25_ON)
+    light = AIOWifiLedBulb("192.168.1.166")
+
+    task = asyncio.create_task(light.async_setup(_noop_callback))
+    transport, protocol = await mock_aio_protocol()
+    light._aio_protocol.data_received(state)
+    await task
+    return light, transport, protocol
+
+
 async def test_no_initial_response(mock_aio_protocol):
     """Test we try switching protocol if we get no initial response."""
     light = AIOWifiLedBulb("192.168.1.166", timeout=0.01)
     assert light.protocol is None
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     transport, protocol = await mock_aio_protocol()
     with pytest.raises(RuntimeError):
         await task
 
     assert transport.mock_calls == [
         call.get_extra_info("peername"),
-        call.write(bytearray(b"\x81\x8a\x8b\x96")),
+        call.write(b"\x81\x8a\x8b\x96"),
         call.write_eof(),
         call.close(),
     ]
@@ -203,15 +292,11 @@ async def test_no_initial_response(mock_aio_protocol):
     assert light.protocol is PROTOCOL_LEDENET_ORIGINAL
 
 
-@pytest.mark.asyncio
 async def test_invalid_initial_response(mock_aio_protocol):
     """Test we try switching protocol if we an unexpected response."""
     light = AIOWifiLedBulb("192.168.1.166", timeout=0.01)
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     transport, protocol = await mock_aio_protocol()
     light._aio_protocol.data_received(b"\x31\x25")
     with pytest.raises(RuntimeError):
@@ -219,41 +304,31 @@ async def test_invalid_initial_response(mock_aio_protocol):
 
     assert transport.mock_calls == [
         call.get_extra_info("peername"),
-        call.write(bytearray(b"\x81\x8a\x8b\x96")),
+        call.write(b"\x81\x8a\x8b\x96"),
         call.write_eof(),
         call.close(),
     ]
     assert not light.available
 
 
-@pytest.mark.asyncio
 async def test_cannot_determine_strip_type(mock_aio_protocol):
     """Test we raise RuntimeError when we cannot determine the strip type."""
     light = AIOWifiLedBulb("192.168.1.166", timeout=0.01)
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     await mock_aio_protocol()
     # protocol state
-    light._aio_protocol.data_received(
-        b"\x81\xa3#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\xd5"
-    )
+    light._aio_protocol.data_received(STATE_0XA3)
     with pytest.raises(RuntimeError):
         await task
     assert not light.available
 
 
-@pytest.mark.asyncio
 async def test_setting_discovery(mock_aio_protocol):
     """Test we can pass discovery to AIOWifiLedBulb."""
     light = AIOWifiLedBulb("192.168.1.166", timeout=0.01)
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     await mock_aio_protocol()
     # protocol state
     light._aio_protocol.data_received(
@@ -283,20 +358,9 @@ async def test_setting_discovery(mock_aio_protocol):
     assert light.discovery == discovery
 
 
-@pytest.mark.asyncio
-async def test_reassemble(mock_aio_protocol):
+async def test_reassemble(ready_light):
     """Test we can reassemble."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.color_modes == {COLOR_MODE_RGBWW, COLOR_MODE_CCT}
     assert light.protocol == PROTOCOL_LEDENET_9BYTE
     assert light.model_num == 0x25
@@ -304,49 +368,63 @@ async def test_reassemble(mock_aio_protocol):
     assert light.is_on is True
     assert len(light.effect_list) == 21
 
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-        b"\x81\x25\x24\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xdf"
-    )
-    await asyncio.sleep(0)
+    light._aio_protocol.data_received(STATE_0X25_ON + STATE_0X25_OFF)
     assert light.is_on is False
 
-    light._aio_protocol.data_received(b"\x81")
-    light._aio_protocol.data_received(
-        b"\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f"
-    )
-    light._aio_protocol.data_received(b"\xde")
-    await asyncio.sleep(0)
-    assert light.is_on is True
-
     transport.reset_mock()
     await light.async_set_device_config()
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"b\x05\x0fv"
+    assert transport.mock_calls[0] == call.write(b"b\x05\x0fv")
 
     transport.reset_mock()
     await light.async_set_device_config(operating_mode="CCT")
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"b\x02\x0fs"
+    assert transport.mock_calls[0] == call.write(b"b\x02\x0fs")
 
 
-@pytest.mark.asyncio
-async def test_extract_from_outer_message(mock_aio_protocol):
-    """Test we can can extract a message wrapped with an outer message."""
-    light = AIOWifiLedBulb("192.168.1.166")
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        pytest.param([STATE_0X25_OFF], id="whole"),
+        pytest.param(
+            [STATE_0X25_OFF[:1], STATE_0X25_OFF[1:-1], STATE_0X25_OFF[-1:]],
+            id="split",
+        ),
+        pytest.param(
+            [STATE_0X25_OFF[idx : idx + 1] for idx in range(len(STATE_0X25_OFF))],
+            id="bytewise",
+        ),
+        pytest.param(
+            [
+                STATE_0X25_ON[:7],
+                STATE_0X25_ON[7:] + STATE_0X25_OFF[:7],
+                STATE_0X25_OFF[7:],
+            ],
+            id="across_frames",
+        ),
+    ],
+)
+async def test_reassemble_chunks(ready_light, chunks):
+    """Test we can reassemble a state response split across reads."""
+    light, _, _ = ready_light
+    assert light.is_on is True
 
-    def _updated_callback(*args, **kwargs):
-        pass
+    for chunk in chunks:
+        light._aio_protocol.data_received(chunk)
+    assert light.is_on is False
 
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    await mock_aio_protocol()
-    light._aio_protocol.data_received(
+
+@pytest.mark.parametrize(
+    "ready_light",
+    [
         b"\xb0\xb1\xb2\xb3\x00\x01\x01\x81\x00\x0e\x81\x1a\x23\x61\x07\x00\xff\x00\x00\x00\x01\x00\x06\x2c\xaf"
         b"\xb0\xb1\xb2\xb3\x00\x01\x01\x81\x00\x0e\x81\x1a\x23\x61\x07\x00\xff\x00\x00\x00\x01\x00\x06\x2c\xaf"
-    )
-    await task
+    ],
+    indirect=True,
+)
+async def test_extract_from_outer_message(ready_light):
+    """Test we can can extract a message wrapped with an outer message."""
+    light, transport, protocol = ready_light
     assert light.color_modes == {COLOR_MODE_RGB}
     assert light.protocol == PROTOCOL_LEDENET_ADDRESSABLE_CHRISTMAS
     assert light.model_num == 0x1A
@@ -356,18 +434,15 @@ async def test_extract_from_outer_message(mock_aio_protocol):
     assert light.rgb == (255, 0, 0)
 
 
-@pytest.mark.asyncio
 async def test_extract_from_outer_message_and_reassemble(mock_aio_protocol):
     """Test we can can extract a message wrapped with an outer message."""
     light = AIOWifiLedBulb("192.168.1.166")
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     await mock_aio_protocol()
-    for byte in b"\xb0\xb1\xb2\xb3\x00\x01\x01\x81\x00\x0e\x81\x1a\x23\x61\x07\x00\xff\x00\x00\x00\x01\x00\x06\x2c\xaf":
-        light._aio_protocol.data_received(bytearray([byte]))
+    msg = b"\xb0\xb1\xb2\xb3\x00\x01\x01\x81\x00\x0e\x81\x1a\x23\x61\x07\x00\xff\x00\x00\x00\x01\x00\x06\x2c\xaf"
+    for idx in range(len(msg)):
+        light._aio_protocol.data_received(msg[idx : idx + 1])
     await task
     assert light.color_modes == {COLOR_MODE_RGB}
     assert light.protocol == PROTOCOL_LEDENET_ADDRESSABLE_CHRISTMAS
@@ -378,20 +453,9 @@ async def test_extract_from_outer_message_and_reassemble(mock_aio_protocol):
     assert light.rgb == (255, 0, 0)
 
 
-@pytest.mark.asyncio
-async def test_turn_on_off(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+async def test_turn_on_off(ready_light, caplog: pytest.LogCaptureFixture):
     """Test we can turn on and off."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    await task
+    light, _, _ = ready_light
 
     data = []
 
@@ -404,84 +468,75 @@ async def test_turn_on_off(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
     ):
         data = [
             b"\xf0\x71\x24\x85",
-            b"\x81\x25\x24\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xdf",
+            STATE_0X25_OFF,
         ]
         await light.async_turn_off()
-        await asyncio.sleep(0)
         assert light.is_on is False
         assert len(data) == 1
 
         data = [
             b"\xf0\x71\x24\x85",
-            b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde",
+            STATE_0X25_ON,
         ]
         await light.async_turn_on()
-        await asyncio.sleep(0)
         assert light.is_on is True
         assert len(data) == 0
 
         data = [b"\xf0\x71\x24\x85"]
         await light.async_turn_off()
-        await asyncio.sleep(0)
         assert light.is_on is False
         assert len(data) == 0
 
         data = [
-            b"\x81\x25\x24\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xdf",
-            b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde",
+            STATE_0X25_OFF,
+            STATE_0X25_ON,
         ]
         await light.async_turn_on()
-        await asyncio.sleep(0)
         assert light.is_on is True
         assert len(data) == 0
 
         data = [
-            b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde",
-            b"\x81\x25\x24\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xdf",
+            STATE_0X25_ON,
+            STATE_0X25_OFF,
         ]
         await light.async_turn_off()
-        await asyncio.sleep(0)
         assert light.is_on is False
         assert len(data) == 0
 
         data = [
             *(
                 b"\xf0\x71\x24\x85",
-                b"\x81\x25\x24\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xdf",
+                STATE_0X25_OFF,
             )
             * 5
         ]
         await light.async_turn_on()
-        await asyncio.sleep(0)
         assert light.is_on is True
         assert len(data) == 3
-        light._aio_protocol.data_received(
-            b"\x81\x25\x24\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xdf"
-        )
+        light._aio_protocol.data_received(STATE_0X25_OFF)
         assert (
             light.is_on is True
         )  # transition time should now be in effect since we forced state
 
-        data = [*(b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde",) * 14]
+        data = [*(STATE_0X25_ON,) * 14]
         await light.async_turn_off()
-        await asyncio.sleep(0)
         # If all we get is on 0x81 responses, the bulb failed to turn off
         assert light.is_on is True
         assert len(data) == 2
 
     await asyncio.sleep(0)
     caplog.clear()
-    caplog.set_level(logging.DEBUG)
-    # Handle the failure case
-    with patch.object(aiodevice, "POWER_STATE_TIMEOUT", 0.010):
+    # Handle the failure case, nothing will respond so there is
+    # no reason to wait for the power state timeout
+    with (
+        caplog.at_level(logging.DEBUG),
+        patch.object(aiodevice, "POWER_STATE_TIMEOUT", 0),
+    ):
         await asyncio.create_task(light.async_turn_off())
         assert light.is_on is True
-        assert "Failed to set power state to False (1/6)" in caplog.text
-        assert "Failed to set power state to False (2/6)" in caplog.text
-        assert "Failed to set power state to False (3/6)" in caplog.text
-        assert "Failed to set power state to False (4/6)" in caplog.text
-        assert "Failed to set power state to False (5/6)" in caplog.text
-        assert "Failed to set power state to False (6/6)" in caplog.text
+        log_text = caplog.text
+        for attempt in range(1, 7):
+            assert f"Failed to set power state to False ({attempt}/6)" in log_text
 
     with (
         patch.object(light._aio_protocol, "write", _send_data),
@@ -489,8 +544,8 @@ async def test_turn_on_off(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
     ):
         data = [
             *(
-                b"\x0f\x71\x24\xa4",
-                b"\x81\x25\x24\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xdf",
+                POWER_OFF_RESPONSE,
+                STATE_0X25_OFF,
             )
             * 5
         ]
@@ -501,7 +556,7 @@ async def test_turn_on_off(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
         data = [
             *(
                 b"\xf0\x71\x23\xa3",
-                b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde",
+                STATE_0X25_ON,
             )
             * 5
         ]
@@ -511,8 +566,8 @@ async def test_turn_on_off(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
 
         data = [
             *(
-                b"\x0f\x71\x24\xa4",
-                b"\x81\x25\x24\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xdf",
+                POWER_OFF_RESPONSE,
+                STATE_0X25_OFF,
             )
             * 5
         ]
@@ -522,76 +577,54 @@ async def test_turn_on_off(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
 
     await asyncio.sleep(0)
     caplog.clear()
-    caplog.set_level(logging.DEBUG)
-    # Handle the failure case
-    with patch.object(aiodevice, "POWER_STATE_TIMEOUT", 0.010):
+    # Handle the failure case, nothing will respond so there is
+    # no reason to wait for the power state timeout
+    with (
+        caplog.at_level(logging.DEBUG),
+        patch.object(aiodevice, "POWER_STATE_TIMEOUT", 0),
+    ):
         await asyncio.create_task(light.async_turn_on())
         assert light.is_on is False
-        assert "Failed to set power state to True (1/6)" in caplog.text
-        assert "Failed to set power state to True (2/6)" in caplog.text
-        assert "Failed to set power state to True (3/6)" in caplog.text
-        assert "Failed to set power state to True (4/6)" in caplog.text
-        assert "Failed to set power state to True (5/6)" in caplog.text
-        assert "Failed to set power state to True (6/6)" in caplog.text
+        log_text = caplog.text
+        for attempt in range(1, 7):
+            assert f"Failed to set power state to True ({attempt}/6)" in log_text
 
 
-@pytest.mark.asyncio
-async def test_turn_on_off_via_power_state_message(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_turn_on_off_via_power_state_message(mock_aio_protocol):
     """Test we can turn on and off via power state message."""
     light = AIOWifiLedBulb("192.168.1.166")
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
     with patch.object(aiodevice, "POWER_STATE_TIMEOUT", 0.010):
-        task = asyncio.create_task(light.async_setup(_updated_callback))
+        task = asyncio.create_task(light.async_setup(_noop_callback))
         await mock_aio_protocol()
-        light._aio_protocol.data_received(
-            b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-        )
+        light._aio_protocol.data_received(STATE_0X25_ON)
         await task
 
         task = asyncio.create_task(light.async_turn_off())
         # Wait for the future to get added
         await asyncio.sleep(0)
         light._ignore_next_power_state_update = False
-        light._aio_protocol.data_received(b"\x0f\x71\x24\xa4")
-        await asyncio.sleep(0)
+        light._aio_protocol.data_received(POWER_OFF_RESPONSE)
         assert light.is_on is False
         await task
 
         task = asyncio.create_task(light.async_turn_on())
         await asyncio.sleep(0)
         light._ignore_next_power_state_update = False
-        light._aio_protocol.data_received(b"\x0f\x71\x23\xa3")
-        await asyncio.sleep(0)
+        light._aio_protocol.data_received(POWER_ON_RESPONSE)
         assert light.is_on is True
         await task
 
 
-@pytest.mark.asyncio
-async def test_turn_on_off_via_assessable_state_message(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_turn_on_off_via_assessable_state_message(mock_aio_protocol):
     """Test we can turn on and off via addressable state message."""
     light = AIOWifiLedBulb("192.168.1.166")
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
     with patch.object(aiodevice, "POWER_STATE_TIMEOUT", 0.025):
-        task = asyncio.create_task(light.async_setup(_updated_callback))
+        task = asyncio.create_task(light.async_setup(_noop_callback))
         await mock_aio_protocol()
-        # protocol state
-        light._aio_protocol.data_received(
-            b"\x81\xa3#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\xd5"
-        )
-        # ic sorting
-        light._aio_protocol.data_received(
-            b"\x00\x63\x00\x19\x00\x02\x04\x03\x19\x02\xa0"
-        )
+        # protocol state followed by the ic state
+        light._aio_protocol.data_received(STATE_0XA3 + IC_STATE)
         await task
 
         data = None
@@ -609,70 +642,39 @@ async def test_turn_on_off_via_assessable_state_message(
             assert light.is_on is True
 
 
-@pytest.mark.asyncio
-async def test_shutdown(mock_aio_protocol):
+async def test_shutdown(ready_light):
     """Test we can shutdown."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    await task
+    light, _, _ = ready_light
 
     await light.async_stop()
-    await asyncio.sleep(0)  # make sure nothing throws
 
 
-@pytest.mark.asyncio
 async def test_handling_connection_lost(mock_aio_protocol):
     """Test we can reconnect."""
     light = AIOWifiLedBulb("192.168.1.166")
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
     with patch.object(aiodevice, "POWER_STATE_TIMEOUT", 0.025):
-        task = asyncio.create_task(light.async_setup(_updated_callback))
+        task = asyncio.create_task(light.async_setup(_noop_callback))
         await mock_aio_protocol()
-        light._aio_protocol.data_received(
-            b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-        )
+        light._aio_protocol.data_received(STATE_0X25_ON)
         await task
 
         light._aio_protocol.connection_lost(None)
-        await asyncio.sleep(0)  # make sure nothing throws
 
         # Test we reconnect and can turn off
         task = asyncio.create_task(light.async_turn_off())
-        # Wait for the future to get added
-        await asyncio.sleep(0.1)  # wait for reconnect
-        light._aio_protocol.data_received(
-            b"\x81\x25\x24\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xdf"
-        )
+        # The mocked connection is made without a real await, so the
+        # reconnect and the state change are done after one iteration
         await asyncio.sleep(0)
+        assert light._aio_protocol is not None
+        light._aio_protocol.data_received(STATE_0X25_OFF)
         assert light.is_on is False
         await task
 
 
-@pytest.mark.asyncio
-async def test_handling_unavailable_after_no_response(mock_aio_protocol):
+async def test_handling_unavailable_after_no_response(ready_light):
     """Test we handle the bulb not responding."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    await task
+    light, _, _ = ready_light
 
     await light.async_update()
     await light.async_update()
@@ -683,33 +685,21 @@ async def test_handling_unavailable_after_no_response(mock_aio_protocol):
     assert light.available is False
 
 
-@pytest.mark.asyncio
-async def test_handling_unavailable_after_no_response_force(mock_aio_protocol):
+@pytest.mark.parametrize(
+    "ready_light",
+    [STATE_0XA3 + IC_STATE_SK6812RGBW],
+    indirect=True,
+)
+async def test_handling_unavailable_after_no_response_force(ready_light):
     """Test we handle the bulb not responding."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, original_aio_protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\xa3#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\xd5"
-    )
-    # ic state
-    light._aio_protocol.data_received(
-        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x00\x00\x0b\x00\x63\x00\x90\x00\x01\x07\x08\x90\x01\x94\xfb"
-    )
-    await task
+    light, transport, original_aio_protocol = ready_light
     assert light._protocol.power_push_updates is True
 
     transport.reset_mock()
     await light.async_update()
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\x04\x81\x8a\x8b\x96\xf9"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\x04\x81\x8a\x8b\x96\xf9"
     )
 
     light._last_update_time = time.monotonic() - (PUSH_UPDATE_INTERVAL + 1)
@@ -729,42 +719,30 @@ async def test_handling_unavailable_after_no_response_force(mock_aio_protocol):
     light._aio_protocol = original_aio_protocol
 
     transport.reset_mock()
-    light._aio_protocol.data_received(
-        b"\x81\xa3#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\xd5"
-    )
+    light._aio_protocol.data_received(STATE_0XA3)
     await light.async_update(force=True)
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x06\x00\x04\x81\x8a\x8b\x96\xfe"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x06\x00\x04\x81\x8a\x8b\x96\xfe"
     )
     assert light.available is True
-    light._aio_protocol.data_received(
-        b"\x81\xa3#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\xd5"
-    )
+    light._aio_protocol.data_received(STATE_0XA3)
     assert light.available is True
 
 
-@pytest.mark.asyncio
-async def test_async_set_levels(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\x33\x24\x61\x23\x01\x00\xff\x00\x00\x04\x00\x0f\x6f"],
+    indirect=True,
+)
+async def test_async_set_levels(ready_light):
     """Test we can set levels."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x33\x24\x61\x23\x01\x00\xff\x00\x00\x04\x00\x0f\x6f"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x33
     assert light.version_num == 4
     assert light.wiring == "GRB"
     assert light.wiring_num == 2
-    assert light.wirings == ["RGB", "GRB", "BRG"]
+    assert light.wirings == RGB_WIRINGS
     assert light.operating_mode is None
     assert light.dimmable_effects is False
     assert light.requires_turn_on is True
@@ -774,14 +752,12 @@ async def test_async_set_levels(mock_aio_protocol, caplog: pytest.LogCaptureFixt
     transport.reset_mock()
     await light.async_set_device_config()
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"b\x00\x02\x0fs"
+    assert transport.mock_calls[0] == call.write(b"b\x00\x02\x0fs")
 
     transport.reset_mock()
     await light.async_set_device_config(wiring="BRG")
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"b\x00\x03\x0ft"
+    assert transport.mock_calls[0] == call.write(b"b\x00\x03\x0ft")
 
     transport.reset_mock()
     with pytest.raises(ValueError):
@@ -790,8 +766,7 @@ async def test_async_set_levels(mock_aio_protocol, caplog: pytest.LogCaptureFixt
 
     await light.async_set_levels(255, 0, 0)
 
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\xff\x00\x00\x00\x00\x0f?"
+    assert transport.mock_calls[0] == call.write(b"1\xff\x00\x00\x00\x00\x0f?")
 
     # light is on
     light._aio_protocol.data_received(
@@ -802,7 +777,6 @@ async def test_async_set_levels(mock_aio_protocol, caplog: pytest.LogCaptureFixt
     await light.async_update()
     await light.async_update()
     await light.async_update()
-    await asyncio.sleep(0)
     assert len(transport.mock_calls) == 4
 
     # light is off
@@ -814,29 +788,20 @@ async def test_async_set_levels(mock_aio_protocol, caplog: pytest.LogCaptureFixt
     await light.async_update()
     await light.async_update()
     await light.async_update()
-    await asyncio.sleep(0)
     assert len(transport.mock_calls) == 4
 
     with pytest.raises(ValueError):
         await light.async_set_preset_pattern(101, 50, 100)
 
 
-@pytest.mark.asyncio
-async def test_async_set_levels_0x52(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\x52\x23\x61\x00\x00\xff\x00\x00\x00\x01\x00\x00\x57"],
+    indirect=True,
+)
+async def test_async_set_levels_0x52(ready_light):
     """Test we can set levels."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x52\x23\x61\x00\x00\xff\x00\x00\x00\x01\x00\x00\x57"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x52
     assert light.version_num == 1
     assert light.wiring is None
@@ -855,78 +820,61 @@ async def test_async_set_levels_0x52(
 
     transport.reset_mock()
     await light.async_set_levels(0, 0, 0, 255, 255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\xff\xff\x00\x00\x00\x0f>"
+    assert transport.mock_calls[0] == call.write(b"1\xff\xff\x00\x00\x00\x0f>")
 
     transport.reset_mock()
     await light.async_set_levels(0, 0, 0, 128, 255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x80\xff\x00\x00\x00\x0f\xbf"
+    assert transport.mock_calls[0] == call.write(b"1\x80\xff\x00\x00\x00\x0f\xbf")
 
     transport.reset_mock()
     await light.async_set_levels(0, 0, 0, 0, 128)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x00\x80\x00\x00\x00\x0f\xc0"
+    assert transport.mock_calls[0] == call.write(b"1\x00\x80\x00\x00\x00\x0f\xc0")
 
 
-@pytest.mark.asyncio
-async def test_async_set_effect(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+@pytest.mark.parametrize(
+    "ready_light",
+    [STATE_0XA3 + IC_STATE],
+    indirect=True,
+)
+async def test_async_set_effect(ready_light):
     """Test we can set an effect."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\xa3#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\xd5"
-    )
-    # ic state
-    light._aio_protocol.data_received(b"\x00\x63\x00\x19\x00\x02\x04\x03\x19\x02\xa0")
-    await task
-    assert light.model_num == 0xA3
-    assert light.dimmable_effects is True
-    assert light.requires_turn_on is False
-    assert light._protocol.power_push_updates is True
-    assert light._protocol.state_push_updates is True
+    light, transport, protocol = ready_light
+    assert light.model_num == 0xA3
+    assert light.dimmable_effects is True
+    assert light.requires_turn_on is False
+    assert light._protocol.power_push_updates is True
+    assert light._protocol.state_push_updates is True
 
     transport.reset_mock()
     await light.async_set_effect("random", 50)
     assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0].startswith(b"\xb0\xb1\xb2\xb3")
+    assert transport.mock_calls[0][1][0].startswith(OUTER_MESSAGE_PREFIX)
 
     transport.reset_mock()
     await light.async_set_effect("RBM 1", 50)
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x02\x00\x05B\x012d\xd9\x81"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x02\x00\x05B\x012d\xd9\x81"
     )
     assert light.effect == "RBM 1"
 
     transport.reset_mock()
     await light.async_set_brightness(255)
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\x05B\x01\x10d\xb7>"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\x05B\x01\x10d\xb7>"
     )
 
     transport.reset_mock()
     await light.async_set_brightness(128)
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x04\x00\x05B\x01\x102\x85\xdb"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x04\x00\x05B\x01\x102\x85\xdb"
     )
 
-    for i in range(5, 255):
-        transport.reset_mock()
+    transport.reset_mock()
+    for _ in range(5, 255):
         await light.async_set_brightness(128)
-        assert transport.mock_calls[0][0] == "write"
-        counter_byte = transport.mock_calls[0][1][0][7]
-        assert counter_byte == i
+    assert all(mock_call[0] == "write" for mock_call in transport.mock_calls)
+    counter_bytes = [mock_call[1][0][7] for mock_call in transport.mock_calls]
+    assert counter_bytes == list(range(5, 255))
 
     transport.reset_mock()
     await light.async_set_brightness(128)
@@ -935,25 +883,16 @@ async def test_async_set_effect(mock_aio_protocol, caplog: pytest.LogCaptureFixt
     assert counter_byte == 0
 
 
-@pytest.mark.asyncio
-async def test_SK6812RGBW(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+@pytest.mark.parametrize(
+    "ready_light",
+    [STATE_0XA3 + IC_STATE_SK6812RGBW],
+    indirect=True,
+)
+async def test_SK6812RGBW(
+    ready_light, no_device_config_resync, no_command_spacing_delay
+):
     """Test we can set set zone colors."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\xa3#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\xd5"
-    )
-    # ic state
-    light._aio_protocol.data_received(
-        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x00\x00\x0b\x00\x63\x00\x90\x00\x01\x07\x08\x90\x01\x94\xfb"
-    )
-
-    await task
+    light, transport, protocol = ready_light
     assert light.pixels_per_segment == 144
     assert light.segments == 1
     assert light.music_pixels_per_segment == 144
@@ -1003,31 +942,25 @@ async def test_SK6812RGBW(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
     )
     transport.reset_mock()
 
-    with patch.object(light, "_async_device_config_resync", mock_coro):
-        await light.async_set_device_config(ic_type="SK6812RGBW", wiring="WRGB")
+    await light.async_set_device_config(ic_type="SK6812RGBW", wiring="WRGB")
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\x0bb\x00\x90\x00\x01\x07\x06\x90\x01\xf0\x81\xd6"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\x0bb\x00\x90\x00\x01\x07\x06\x90\x01\xf0\x81\xd6"
     )
 
     transport.reset_mock()
-    with patch.object(aiodevice, "COMMAND_SPACING_DELAY", 0):
-        await light.async_set_levels(r=255, g=255, b=255, w=255)
-        assert transport.mock_calls == [
-            call.write(
-                bytearray(
-                    b"\xb0\xb1\xb2\xb3\x00\x01\x01\x02\x00\rA\x01\xff\xff\xff\x00\x00\x00`\xff\x00\x00\x9e\x13"
-                )
-            ),
-            call.write(bytearray(b"\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\x03G\xffFZ")),
-        ]
+    await light.async_set_levels(r=255, g=255, b=255, w=255)
+    assert transport.mock_calls == [
+        call.write(
+            b"\xb0\xb1\xb2\xb3\x00\x01\x01\x02\x00\rA\x01\xff\xff\xff\x00\x00\x00`\xff\x00\x00\x9e\x13"
+        ),
+        call.write(b"\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\x03G\xffFZ"),
+    ]
 
     transport.reset_mock()
     await light.async_set_levels(w=255)
     assert transport.mock_calls == [
-        call.write(bytearray(b"\xb0\xb1\xb2\xb3\x00\x01\x01\x04\x00\x03G\xffF["))
+        call.write(b"\xb0\xb1\xb2\xb3\x00\x01\x01\x04\x00\x03G\xffF[")
     ]
     light._transition_complete_time = 0
 
@@ -1045,39 +978,26 @@ async def test_SK6812RGBW(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
     assert light.raw_state.warm_white == 125
 
     transport.reset_mock()
-    with patch.object(aiodevice, "COMMAND_SPACING_DELAY", 0):
-        await light.async_set_white_temp(6500, 255)
-        assert transport.mock_calls == [
-            call.write(
-                bytearray(
-                    bytearray(
-                        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x05\x00\rA\x01\xff\xff\xff\x00\x00\x00`\xff\x00\x00\x9e\x16"
-                    )
-                )
-            ),
-            call.write(bytearray(b"\xb0\xb1\xb2\xb3\x00\x01\x01\x06\x00\x03G\x00G_")),
-        ]
-
-
-@pytest.mark.asyncio
-async def test_ws2812b_a1(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
-    """Test we can determine ws2812b configuration."""
-    light = AIOWifiLedBulb("192.168.1.166")
+    await light.async_set_white_temp(6500, 255)
+    assert transport.mock_calls == [
+        call.write(
+            b"\xb0\xb1\xb2\xb3\x00\x01\x01\x05\x00\rA\x01\xff\xff\xff\x00\x00\x00`\xff\x00\x00\x9e\x16"
+        ),
+        call.write(b"\xb0\xb1\xb2\xb3\x00\x01\x01\x06\x00\x03G\x00G_"),
+    ]
 
-    def _updated_callback(*args, **kwargs):
-        pass
 
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
+@pytest.mark.parametrize(
+    "ready_light",
+    [
         b"\x81\xa1#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\xd3"
-    )
-    # ic state
-    light._aio_protocol.data_received(
-        b"\x63\x00\x32\x04\x00\x00\x00\x00\x00\x00\x02\x9b"
-    )
-
-    await task
+        + b"\x63\x00\x32\x04\x00\x00\x00\x00\x00\x00\x02\x9b"
+    ],
+    indirect=True,
+)
+async def test_ws2812b_a1(ready_light, no_device_config_resync):
+    """Test we can determine ws2812b configuration."""
+    light, transport, protocol = ready_light
     assert light._protocol.timer_count == 6
     assert light._protocol.timer_len == 14
     assert light._protocol.timer_response_len == 88
@@ -1102,51 +1022,36 @@ async def test_ws2812b_a1(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
     assert light.operating_modes is None
     assert light.wiring == "GRB"
     assert light.wiring_num == 2
-    assert light.wirings == ["RGB", "RBG", "GRB", "GBR", "BRG", "BGR"]
+    assert light.wirings == ADDRESSABLE_RGB_WIRINGS
     assert light.model_num == 0xA1
     assert light.dimmable_effects is False
     assert light.requires_turn_on is False
 
     transport.reset_mock()
-    with patch.object(light, "_async_device_config_resync", mock_coro):
-        await light.async_set_device_config()
+    await light.async_set_device_config()
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"b\x002\x04\x00\x00\x00\x00\x00\x00\x02\xf0\x8a"
+    assert transport.mock_calls[0] == call.write(
+        b"b\x002\x04\x00\x00\x00\x00\x00\x00\x02\xf0\x8a"
     )
 
     transport.reset_mock()
-    with patch.object(light, "_async_device_config_resync", mock_coro):
-        await light.async_set_device_config(
-            ic_type="SK6812", wiring="GRB", pixels_per_segment=300
-        )
+    await light.async_set_device_config(
+        ic_type="SK6812", wiring="GRB", pixels_per_segment=300
+    )
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"b\x01,\x05\x00\x00\x00\x00\x00\x00\x02\xf0\x86"
+    assert transport.mock_calls[0] == call.write(
+        b"b\x01,\x05\x00\x00\x00\x00\x00\x00\x02\xf0\x86"
     )
 
 
-@pytest.mark.asyncio
-async def test_ws2811_a2(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\xa2#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\xd4" + IC_STATE],
+    indirect=True,
+)
+async def test_ws2811_a2(ready_light, no_device_config_resync):
     """Test we can determine ws2811 configuration."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\xa2#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\xd4"
-    )
-    # ic state
-    light._aio_protocol.data_received(b"\x00\x63\x00\x19\x00\x02\x04\x03\x19\x02\xa0")
-
-    await task
+    light, transport, protocol = ready_light
     assert light.pixels_per_segment == 25
     assert light.segments == 2
     assert light.music_pixels_per_segment == 25
@@ -1157,59 +1062,49 @@ async def test_ws2811_a2(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
     assert light.operating_modes is None
     assert light.wiring == "GBR"
     assert light.wiring_num == 3
-    assert light.wirings == ["RGB", "RBG", "GRB", "GBR", "BRG", "BGR"]
+    assert light.wirings == ADDRESSABLE_RGB_WIRINGS
     assert light.model_num == 0xA2
     assert light.dimmable_effects is True
     assert light.requires_turn_on is False
 
     transport.reset_mock()
-    with patch.object(light, "_async_device_config_resync", mock_coro):
-        await light.async_set_device_config()
+    await light.async_set_device_config()
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"b\x00\x19\x00\x02\x04\x03\x19\x02\xf0\x8f"
+    assert transport.mock_calls[0] == call.write(
+        b"b\x00\x19\x00\x02\x04\x03\x19\x02\xf0\x8f"
+    )
 
     transport.reset_mock()
-    with patch.object(light, "_async_device_config_resync", mock_coro):
-        await light.async_set_device_config(
-            ic_type="SK6812", wiring="GRB", pixels_per_segment=300
-        )
+    await light.async_set_device_config(
+        ic_type="SK6812", wiring="GRB", pixels_per_segment=300
+    )
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"b\x01,\x00\x02\x05\x02\x19\x02\xf0\xa3"
+    assert transport.mock_calls[0] == call.write(
+        b"b\x01,\x00\x02\x05\x02\x19\x02\xf0\xa3"
+    )
 
     transport.reset_mock()
-    with patch.object(light, "_async_device_config_resync", mock_coro):
-        await light.async_set_device_config(
-            pixels_per_segment=1000,
-            segments=1000,
-            music_pixels_per_segment=1000,
-            music_segments=1000,
-        )
+    await light.async_set_device_config(
+        pixels_per_segment=1000,
+        segments=1000,
+        music_pixels_per_segment=1000,
+        music_segments=1000,
+    )
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"b\x01,\x00\x06\x04\x03\x96\x06\xf0("
+    assert transport.mock_calls[0] == call.write(b"b\x01,\x00\x06\x04\x03\x96\x06\xf0(")
 
 
-@pytest.mark.asyncio
-async def test_ws2812b_older_a3(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
-    """Test we can determine ws2812b configuration on an older a3."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
+@pytest.mark.parametrize(
+    "ready_light",
+    [
         b"\x81\xa3\x23\x61\x01\x32\x00\x64\x00\x00\x01\x00\x1e\x5e"
-    )
-    # ic state
-    light._aio_protocol.data_received(
-        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x00\x00\x0b\x01\x63\x00\x1e\x00\x0a\x01\x00\x1e\x0a\xb5\x3d"
-    )
-
-    await task
+        + b"\xb0\xb1\xb2\xb3\x00\x01\x01\x00\x00\x0b\x01\x63\x00\x1e\x00\x0a\x01\x00\x1e\x0a\xb5\x3d"
+    ],
+    indirect=True,
+)
+async def test_ws2812b_older_a3(ready_light, no_device_config_resync):
+    """Test we can determine ws2812b configuration on an older a3."""
+    light, transport, protocol = ready_light
     assert light.pixels_per_segment == 30
     assert light.segments == 10
     assert light.music_pixels_per_segment == 30
@@ -1220,68 +1115,48 @@ async def test_ws2812b_older_a3(mock_aio_protocol, caplog: pytest.LogCaptureFixt
     assert light.operating_modes is None
     assert light.wiring == "RGB"
     assert light.wiring_num == 0
-    assert light.wirings == ["RGB", "RBG", "GRB", "GBR", "BRG", "BGR"]
+    assert light.wirings == ADDRESSABLE_RGB_WIRINGS
     assert light.model_num == 0xA3
     assert light.dimmable_effects is True
     assert light.requires_turn_on is False
 
     transport.reset_mock()
-    with patch.object(light, "_async_device_config_resync", mock_coro):
-        await light.async_set_device_config()
+    await light.async_set_device_config()
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\x0bb\x00\x1e\x00\n\x01\x00\x1e\n\xf0\xa3\x1a"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\x0bb\x00\x1e\x00\n\x01\x00\x1e\n\xf0\xa3\x1a"
     )
 
     transport.reset_mock()
-    with patch.object(light, "_async_device_config_resync", mock_coro):
-        await light.async_set_device_config(
-            ic_type="SK6812", wiring="GRB", pixels_per_segment=300
-        )
+    await light.async_set_device_config(
+        ic_type="SK6812", wiring="GRB", pixels_per_segment=300
+    )
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x02\x00\x0bb\x01,\x00\x06\x06\x02\x1e\n\xf0\xb5?"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x02\x00\x0bb\x01,\x00\x06\x06\x02\x1e\n\xf0\xb5?"
     )
 
     transport.reset_mock()
-    with patch.object(light, "_async_device_config_resync", mock_coro):
-        await light.async_set_device_config(
-            pixels_per_segment=1000,
-            segments=1000,
-            music_pixels_per_segment=1000,
-            music_segments=1000,
-        )
+    await light.async_set_device_config(
+        pixels_per_segment=1000,
+        segments=1000,
+        music_pixels_per_segment=1000,
+        music_segments=1000,
+    )
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b'\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\x0bb\x01,\x00\x06\x01\x00\x96\x06\xf0"\x1a'
+    assert transport.mock_calls[0] == call.write(
+        b'\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\x0bb\x01,\x00\x06\x01\x00\x96\x06\xf0"\x1a'
     )
 
 
-@pytest.mark.asyncio
-async def test_async_set_zones(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+@pytest.mark.parametrize(
+    "ready_light",
+    [STATE_0XA3 + IC_STATE + IC_STATE],
+    indirect=True,
+)
+async def test_async_set_zones(ready_light, no_device_config_resync):
     """Test we can set set zone colors."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\xa3#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\xd5"
-    )
-    # ic state
-    light._aio_protocol.data_received(b"\x00\x63\x00\x19\x00\x02\x04\x03\x19\x02\xa0")
-    # sometimes the devices responds 2x
-    light._aio_protocol.data_received(b"\x00\x63\x00\x19\x00\x02\x04\x03\x19\x02\xa0")
-
-    await task
+    light, transport, protocol = ready_light
     assert light.pixels_per_segment == 25
     assert light.segments == 2
     assert light.music_pixels_per_segment == 25
@@ -1303,53 +1178,44 @@ async def test_async_set_zones(mock_aio_protocol, caplog: pytest.LogCaptureFixtu
     assert light.operating_modes is None
     assert light.wiring == "GBR"
     assert light.wiring_num == 3
-    assert light.wirings == ["RGB", "RBG", "GRB", "GBR", "BRG", "BGR"]
+    assert light.wirings == ADDRESSABLE_RGB_WIRINGS
     assert light.model_num == 0xA3
     assert light.dimmable_effects is True
     assert light.requires_turn_on is False
 
     transport.reset_mock()
-    with patch.object(light, "_async_device_config_resync", mock_coro):
-        await light.async_set_device_config()
+    await light.async_set_device_config()
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\x0bb\x00\x19\x00\x02\x04\x03\x19\x02\xf0\x8f\xf2"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\x0bb\x00\x19\x00\x02\x04\x03\x19\x02\xf0\x8f\xf2"
     )
 
     transport.reset_mock()
-    with patch.object(light, "_async_device_config_resync", mock_coro):
-        await light.async_set_device_config(
-            ic_type="SK6812",
-            wiring="GRB",
-            pixels_per_segment=300,
-            segments=2,
-            music_pixels_per_segment=150,
-            music_segments=2,
-        )
+    await light.async_set_device_config(
+        ic_type="SK6812",
+        wiring="GRB",
+        pixels_per_segment=300,
+        segments=2,
+        music_pixels_per_segment=150,
+        music_segments=2,
+    )
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x02\x00\x0bb\x01,\x00\x02\x06\x02\x96\x02\xf0!\x17"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x02\x00\x0bb\x01,\x00\x02\x06\x02\x96\x02\xf0!\x17"
     )
 
     transport.reset_mock()
-    with patch.object(light, "_async_device_config_resync", mock_coro):
-        await light.async_set_device_config(
-            ic_type="SK6812",
-            wiring="GRB",
-            pixels_per_segment=300,
-            segments=2,
-            music_pixels_per_segment=300,
-            music_segments=2,
-        )
+    await light.async_set_device_config(
+        ic_type="SK6812",
+        wiring="GRB",
+        pixels_per_segment=300,
+        segments=2,
+        music_pixels_per_segment=300,
+        music_segments=2,
+    )
     assert len(transport.mock_calls) == 1
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\x0bb\x01,\x00\x02\x06\x02\x96\x02\xf0!\x18"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\x0bb\x01,\x00\x02\x06\x02\x96\x02\xf0!\x18"
     )
 
     transport.reset_mock()
@@ -1357,38 +1223,26 @@ async def test_async_set_zones(mock_aio_protocol, caplog: pytest.LogCaptureFixtu
     await light.async_set_zones(
         [(255, 0, 0), (0, 0, 255)], 100, MultiColorEffects.STROBE
     )
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == bytearray(
-        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x04\x00TY\x00T\xff\x00\x00"
-        b"\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff"
-        b"\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00"
-        b"\x00\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff"
-        b"\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00"
-        b"\x00\xff\x00\x00\xff\x00\x00\xff\x00\x1e\x03d\x00\x19R"
+    # 25 pixels split across the two zones: 12 red, then 13 blue
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x04\x00TY\x00T"
+        + b"\xff\x00\x00" * 12
+        + b"\x00\x00\xff" * 13
+        + b"\x00\x1e\x03d\x00\x19R"
     )
 
     with pytest.raises(ValueError):
-        await light.async_set_zones(
-            [(255, 0, 0) for _ in range(30)],
-        )
+        await light.async_set_zones([(255, 0, 0)] * 30)
 
 
-@pytest.mark.asyncio
-async def test_async_set_zones_unsupported_device(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\x25#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\x57"],
+    indirect=True,
+)
+async def test_async_set_zones_unsupported_device(ready_light):
     """Test we can set set zone colors raises valueerror on unsupported."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\x57"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x25
 
     transport.reset_mock()
@@ -1398,20 +1252,14 @@ async def test_async_set_zones_unsupported_device(
         )
 
 
-@pytest.mark.asyncio
-async def test_0x06_device_wiring(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+@pytest.mark.parametrize(
+    "ready_light",
+    [STATE_0X06_OFF],
+    indirect=True,
+)
+async def test_0x06_device_wiring(ready_light):
     """Test we can get wiring for an 0x06."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x06\x24\x61\x24\x01\x00\xff\x00\x00\x03\x00\xf0\x23"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x06
     assert light.pixels_per_segment is None
     assert light.segments is None
@@ -1426,20 +1274,14 @@ async def test_0x06_device_wiring(mock_aio_protocol, caplog: pytest.LogCaptureFi
     assert light.wirings == ["RGBW", "GRBW", "BRGW"]
 
 
-@pytest.mark.asyncio
-async def test_0x07_device_wiring(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\x07\x24\x61\xc7\x01\x00\x00\x00\x00\x02\xff\x0f\xe5"],
+    indirect=True,
+)
+async def test_0x07_device_wiring(ready_light):
     """Test we can get wiring for an 0x07."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x07\x24\x61\xc7\x01\x00\x00\x00\x00\x02\xff\x0f\xe5"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x07
     assert light.pixels_per_segment is None
     assert light.segments is None
@@ -1470,141 +1312,98 @@ async def test_0x07_device_wiring(mock_aio_protocol, caplog: pytest.LogCaptureFi
     ]
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("ready_light", "version_num", "expected_protocol", "rgb", "brightness", "writes"),
+    [
+        pytest.param(
+            STATE_0X08_MUSIC,
+            4,
+            PROTOCOL_LEDENET_8BYTE_DIMMABLE_EFFECTS,
+            (100, 0, 0),
+            100,
+            [call.write(b"s\x01d\x0f\xe7"), call.write(b"7\x00\x007")],
+            id="v4",
+        ),
+        pytest.param(
+            b"\x81\x08\x23\x62\x23\x01\x80\x00\x80\x00\x01\x00\x00\x33",
+            1,
+            PROTOCOL_LEDENET_8BYTE_AUTO_ON,
+            (128, 0, 128),
+            # In music mode, we always report 255 otherwise it will likely be 0
+            255,
+            [call.write(b"s\x01d\x0f\xe7")],
+            id="v1",
+        ),
+        pytest.param(
+            b"\x81\x08\x23\x62\x23\x01\x80\x00\xff\x00\x02\x00\x00\xb3",
+            2,
+            PROTOCOL_LEDENET_8BYTE_DIMMABLE_EFFECTS,
+            (128, 0, 255),
+            255,
+            [call.write(b"s\x01d\x0f\xe7"), call.write(b"7\x00\x007")],
+            id="v2",
+        ),
+    ],
+    indirect=["ready_light"],
+)
 async def test_async_set_music_mode_0x08(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
+    ready_light,
+    version_num,
+    expected_protocol,
+    rgb,
+    brightness,
+    writes,
+    no_command_spacing_delay,
 ):
-    """Test we can set music mode on an 0x08."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    with patch.object(aiodevice, "COMMAND_SPACING_DELAY", 0):
-        task = asyncio.create_task(light.async_setup(_updated_callback))
-        transport, protocol = await mock_aio_protocol()
-        light._aio_protocol.data_received(
-            b"\x81\x08#\x5d\x01\x10\x64\x00\x00\x00\x04\x00\xf0\x72"
-        )
-        await task
-        assert light.model_num == 0x08
-        assert light.version_num == 4
-        assert light.effect == EFFECT_MUSIC
-        assert light.microphone is True
-        assert light.protocol == PROTOCOL_LEDENET_8BYTE_DIMMABLE_EFFECTS
-        assert light.pixels_per_segment is None
-        assert light.segments is None
-        assert light.music_pixels_per_segment is None
-        assert light.music_segments is None
-        assert light.ic_types is None
-        assert light.ic_type is None
-        assert light.operating_mode is None
-        assert light.operating_modes is None
-        assert light.wiring is None  # How can we get this in music mode?
-        assert light.wirings == ["RGB", "GRB", "BRG"]
-
-        transport.reset_mock()
-        await light.async_set_music_mode()
-        assert transport.mock_calls[0][0] == "write"
-        assert transport.mock_calls[0][1][0] == b"s\x01d\x0f\xe7"
-        assert transport.mock_calls[1][0] == "write"
-        assert transport.mock_calls[1][1][0] == b"7\x00\x007"
-
-        transport.reset_mock()
-        await light.async_set_music_mode(effect=2)
-        assert transport.mock_calls[0][0] == "write"
-        assert transport.mock_calls[0][1][0] == b"s\x01d\x0f\xe7"
-        assert transport.mock_calls[1][0] == "write"
-        assert transport.mock_calls[1][1][0] == b"7\x02\x009"
-
-        with pytest.raises(ValueError):
-            await light.async_set_music_mode(effect=0x08)
-
-
-@pytest.mark.asyncio
-async def test_async_set_music_mode_0x08_v1_firmware(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
-    """Test we can set music mode on an 0x08 with v1 firmware."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    with patch.object(aiodevice, "COMMAND_SPACING_DELAY", 0):
-        task = asyncio.create_task(light.async_setup(_updated_callback))
-        transport, protocol = await mock_aio_protocol()
-        light._aio_protocol.data_received(
-            b"\x81\x08\x23\x62\x23\x01\x80\x00\x80\x00\x01\x00\x00\x33"
-        )
-        await task
-        assert light.model_num == 0x08
-        assert light.version_num == 1
-        assert light.effect == EFFECT_MUSIC
-        assert light.microphone is True
-        assert light.raw_state.red == 128
-        assert light.raw_state.green == 0
-        assert light.raw_state.blue == 128
-        assert light.protocol == PROTOCOL_LEDENET_8BYTE_AUTO_ON
-        # In music mode, we always report 255 otherwise it will likely be 0
-        assert light.brightness == 255
-
-        transport.reset_mock()
-        await light.async_set_music_mode()
-        assert len(transport.mock_calls) == 1
-        assert transport.mock_calls[0][0] == "write"
-        assert transport.mock_calls[0][1][0] == b"s\x01d\x0f\xe7"
+    """Test we can set music mode on an 0x08 across firmware versions."""
+    light, transport, _ = ready_light
+    assert light.model_num == 0x08
+    assert light.version_num == version_num
+    assert light.effect == EFFECT_MUSIC
+    assert light.microphone is True
+    assert light.protocol == expected_protocol
+    assert light.rgb == rgb
+    assert light.brightness == brightness
 
+    transport.reset_mock()
+    await light.async_set_music_mode()
+    assert transport.mock_calls == writes
 
-@pytest.mark.asyncio
-async def test_async_set_music_mode_0x08_v2_firmware(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
-    """Test we can set music mode on an 0x08 with v2 firmware."""
-    light = AIOWifiLedBulb("192.168.1.166")
 
-    def _updated_callback(*args, **kwargs):
-        pass
+@pytest.mark.parametrize("ready_light", [STATE_0X08_MUSIC], indirect=True)
+async def test_async_set_music_mode_0x08_effects(ready_light, no_command_spacing_delay):
+    """Test we can pick a music mode effect on an 0x08."""
+    light, transport, _ = ready_light
+    assert light.pixels_per_segment is None
+    assert light.segments is None
+    assert light.music_pixels_per_segment is None
+    assert light.music_segments is None
+    assert light.ic_types is None
+    assert light.ic_type is None
+    assert light.operating_mode is None
+    assert light.operating_modes is None
+    assert light.wiring is None  # How can we get this in music mode?
+    assert light.wirings == RGB_WIRINGS
 
-    with patch.object(aiodevice, "COMMAND_SPACING_DELAY", 0):
-        task = asyncio.create_task(light.async_setup(_updated_callback))
-        transport, protocol = await mock_aio_protocol()
-        light._aio_protocol.data_received(
-            b"\x81\x08\x23\x62\x23\x01\x80\x00\xff\x00\x02\x00\x00\xb3"
-        )
-        await task
-        assert light.model_num == 0x08
-        assert light.version_num == 2
-        assert light.effect == EFFECT_MUSIC
-        assert light.microphone is True
-        assert light.protocol == PROTOCOL_LEDENET_8BYTE_DIMMABLE_EFFECTS
+    transport.reset_mock()
+    await light.async_set_music_mode(effect=2)
+    assert transport.mock_calls == [
+        call.write(b"s\x01d\x0f\xe7"),
+        call.write(b"7\x02\x009"),
+    ]
 
-        transport.reset_mock()
-        await light.async_set_music_mode()
-        assert transport.mock_calls[0][0] == "write"
-        assert transport.mock_calls[0][1][0] == b"s\x01d\x0f\xe7"
-        assert transport.mock_calls[1][0] == "write"
-        assert transport.mock_calls[1][1][0] == b"7\x00\x007"
+    with pytest.raises(ValueError):
+        await light.async_set_music_mode(effect=0x08)
 
 
-@pytest.mark.asyncio
-async def test_async_set_music_mode_a2(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\xa2#\x62\x01\x10\x64\x00\x00\x00\x04\x00\xf0\x11" + IC_STATE],
+    indirect=True,
+)
+async def test_async_set_music_mode_a2(ready_light):
     """Test we can set music mode on an 0xA2."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\xa2#\x62\x01\x10\x64\x00\x00\x00\x04\x00\xf0\x11"
-    )
-    # ic state
-    light._aio_protocol.data_received(b"\x00\x63\x00\x19\x00\x02\x04\x03\x19\x02\xa0")
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0xA2
     assert light.effect == EFFECT_MUSIC
     assert light.microphone is True
@@ -1613,13 +1412,15 @@ async def test_async_set_music_mode_a2(
 
     transport.reset_mock()
     await light.async_set_music_mode()
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"s\x01&\x01d\x00\x00\x00\x00\x00dd\xc7"
+    assert transport.mock_calls[0] == call.write(
+        b"s\x01&\x01d\x00\x00\x00\x00\x00dd\xc7"
+    )
 
     transport.reset_mock()
     await light.async_set_effect(EFFECT_MUSIC, 100, 100)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"s\x01&\x01d\x00\x00\x00\x00\x00dd\xc7"
+    assert transport.mock_calls[0] == call.write(
+        b"s\x01&\x01d\x00\x00\x00\x00\x00dd\xc7"
+    )
 
     # light is on
     light._aio_protocol.data_received(
@@ -1630,7 +1431,6 @@ async def test_async_set_music_mode_a2(
     await light.async_update()
     await light.async_update()
     await light.async_update()
-    await asyncio.sleep(0)
     assert len(transport.mock_calls) == 4
 
     # light is off
@@ -1642,28 +1442,17 @@ async def test_async_set_music_mode_a2(
     await light.async_update()
     await light.async_update()
     await light.async_update()
-    await asyncio.sleep(0)
     assert len(transport.mock_calls) == 4
 
 
-@pytest.mark.asyncio
-async def test_async_set_music_mode_a3(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\xa3#\x62\x01\x10\x64\x00\x00\x00\x04\x00\xf0\x12" + IC_STATE],
+    indirect=True,
+)
+async def test_async_set_music_mode_a3(ready_light):
     """Test we can set music mode on an 0xA3."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\xa3#\x62\x01\x10\x64\x00\x00\x00\x04\x00\xf0\x12"
-    )
-    # ic state
-    light._aio_protocol.data_received(b"\x00\x63\x00\x19\x00\x02\x04\x03\x19\x02\xa0")
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0xA3
     assert light.effect == EFFECT_MUSIC
     assert light.microphone is True
@@ -1671,7 +1460,7 @@ async def test_async_set_music_mode_a3(
     transport.reset_mock()
     await light.async_set_music_mode()
     assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0].startswith(b"\xb0\xb1\xb2\xb3")
+    assert transport.mock_calls[0][1][0].startswith(OUTER_MESSAGE_PREFIX)
 
     with pytest.raises(ValueError):
         await light.async_set_music_mode(mode=0x08)
@@ -1680,22 +1469,14 @@ async def test_async_set_music_mode_a3(
         await light.async_set_music_mode(effect=0x99)
 
 
-@pytest.mark.asyncio
-async def test_async_set_music_mode_device_without_mic_0x07(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\x07#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\x39"],
+    indirect=True,
+)
+async def test_async_set_music_mode_device_without_mic_0x07(ready_light):
     """Test we can set music mode on an 0x08."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x07#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\x39"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x07
     assert light.microphone is False
 
@@ -1704,70 +1485,46 @@ async def test_async_set_music_mode_device_without_mic_0x07(
         await light.async_set_music_mode()
 
 
-@pytest.mark.asyncio
-async def test_async_set_white_temp_0x35(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\x35\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xee"],
+    indirect=True,
+)
+async def test_async_set_white_temp_0x35(ready_light):
     """Test we can set white temp on a 0x35."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x35\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xee"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x35
 
     transport.reset_mock()
     await light.async_set_white_temp(6500, 255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x00\x00\x00\x00\xff\x0f\x0fN"
+    assert transport.mock_calls[0] == call.write(b"1\x00\x00\x00\x00\xff\x0f\x0fN")
 
 
-@pytest.mark.asyncio
-async def test_setup_0x35_with_ZJ21410(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
-    """Test we can setup a 0x35 with the ZJ21410 module."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
+@pytest.mark.parametrize(
+    "ready_light",
+    [
         b"\xb0\xb1\xb2\xb3\x00\x02\x01\x70\x00\x0e\x81\x35\x23\x61\x17\x04\xd3\xff\x49\x00\x09\x00\xf0\x69\x19"
-    )
-    await task
+    ],
+    indirect=True,
+)
+async def test_setup_0x35_with_ZJ21410(ready_light):
+    """Test we can setup a 0x35 with the ZJ21410 module."""
+    light, transport, protocol = ready_light
     assert light.model_num == 0x35
 
 
-@pytest.mark.asyncio
-async def test_setup_0x44_with_version_num_10(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\x44\x24\x61\x01\x01\xff\x00\xff\x00\x0a\x00\xf0\x44"],
+    indirect=True,
+)
+async def test_setup_0x44_with_version_num_10(ready_light):
     """Test we use the right protocol for 044 with v10."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x44\x24\x61\x01\x01\xff\x00\xff\x00\x0a\x00\xf0\x44"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x44
     assert light.protocol == PROTOCOL_LEDENET_8BYTE_AUTO_ON
 
 
-@pytest.mark.asyncio
 async def test_async_failed_callback(
     mock_aio_protocol, caplog: pytest.LogCaptureFixture
 ):
@@ -1780,11 +1537,8 @@ async def test_async_failed_callback(
 
     task = asyncio.create_task(light.async_setup(_updated_callback))
     transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\xa3#\x25\x01\x10\x64\x00\x00\x00\x04\x00\xf0\xd5"
-    )
-    # ic state
-    light._aio_protocol.data_received(b"\x00\x63\x00\x19\x00\x02\x04\x03\x19\x02\xa0")
+    # protocol state followed by the ic state
+    light._aio_protocol.data_received(STATE_0XA3 + IC_STATE)
     await task
     assert light.model_num == 0xA3
     assert light.dimmable_effects is True
@@ -1792,22 +1546,9 @@ async def test_async_failed_callback(
     assert "something went wrong" in caplog.text
 
 
-@pytest.mark.asyncio
-async def test_async_set_custom_effect(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_async_set_custom_effect(ready_light):
     """Test we can set a custom effect."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x25
 
     transport.reset_mock()
@@ -1836,245 +1577,94 @@ async def test_async_set_custom_effect(
             (255, 0, 0),
             (255, 0, 0),
         ],
-        50,
-        "jump",
-    )
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"Q\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\xff\x00\xff\x00\x00\x00\x10;\xff\x0f\x99"
-    )
-
-
-@pytest.mark.asyncio
-async def test_async_stop(mock_aio_protocol):
-    """Test we can stop without throwing."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    await task
-
-    await light.async_stop()
-    await asyncio.sleep(0)  # make sure nothing throws
-
-
-@pytest.mark.asyncio
-async def test_async_set_brightness_rgbww(mock_aio_protocol):
-    """Test we can set brightness rgbww."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    await task
-
-    transport.reset_mock()
-    await light.async_set_brightness(255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\xff\x00\xd5\xff\xff\x00\x0f\x12"
-
-    transport.reset_mock()
-    await light.async_set_brightness(128)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x80\x00k\x80\x80\x00\x0f+"
-
-
-@pytest.mark.asyncio
-async def test_async_set_brightness_cct_0x25(mock_aio_protocol):
-    """Test we can set brightness with a 0x25 cct device."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x02\x10\xb6\x00\x98\x19\x04\x25\x0f\xdb"
-    )
-    await task
-
-    transport.reset_mock()
-    await light.async_set_brightness(255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x00\x00\x00g\x98\x00\x0f?"
-    assert light.brightness == 255
-
-    transport.reset_mock()
-    await light.async_set_brightness(128)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x00\x00\x004L\x00\x0f\xc0"
-    assert light.brightness == 128
-
-
-@pytest.mark.asyncio
-async def test_async_set_brightness_cct_0x07(mock_aio_protocol):
-    """Test we can set brightness with a 0x07 cct device."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x07\x24\x61\xc7\x01\x00\x00\x00\x00\x02\xff\x0f\xe5"
-    )
-    await task
-
-    transport.reset_mock()
-    await light.async_set_brightness(255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x00\x00\x00\x00\xff\x0f\x0fN"
-    assert light.brightness == 255
-
-    transport.reset_mock()
-    await light.async_set_brightness(128)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x00\x00\x00\x00\x80\x0f\x0f\xcf"
-    assert light.brightness == 128
-
-
-@pytest.mark.asyncio
-async def test_async_set_brightness_dim(mock_aio_protocol):
-    """Test we can set brightness with a dim only device."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x01\x10\xb6\x00\x98\x19\x04\x25\x0f\xda"
-    )
-    await task
-
-    transport.reset_mock()
-    await light.async_set_brightness(255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x00\x00\x00\xff\xff\x00\x0f>"
-    assert light.brightness == 255
-
-    transport.reset_mock()
-    await light.async_set_brightness(128)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x00\x00\x00\x80\x80\x00\x0f@"
-    assert light.brightness == 128
-
-
-@pytest.mark.asyncio
-async def test_async_set_brightness_rgb_0x33(mock_aio_protocol):
-    """Test we can set brightness with a rgb only device."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x33\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xec"
-    )
-    await task
-
-    transport.reset_mock()
-    await light.async_set_brightness(255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\xff\x00\xd4\x00\x00\x0f\x13"
-    assert light.brightness == 255
-
-    transport.reset_mock()
-    await light.async_set_brightness(128)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x80\x00j\x00\x00\x0f*"
-    assert light.brightness == 128
-
-
-@pytest.mark.asyncio
-async def test_async_set_brightness_rgb_0x25(mock_aio_protocol):
-    """Test we can set brightness with a 0x25 device."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x03\x10\xb6\x00\x98\x19\x04\x25\x0f\xdc"
-    )
-    await task
-
-    transport.reset_mock()
-    await light.async_set_brightness(255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\xff\x00\xd4\x00\x00\x00\x0f\x13"
-    assert light.brightness == 255
+        50,
+        "jump",
+    )
+    assert transport.mock_calls[0] == call.write(
+        b"Q\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\xff\x00\xff\x00\xff\x00\x00\x00\x10;\xff\x0f\x99"
+    )
 
-    transport.reset_mock()
-    await light.async_set_brightness(128)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x80\x00j\x00\x00\x00\x0f*"
-    assert light.brightness == 128
 
+async def test_async_stop(ready_light):
+    """Test we can stop without throwing."""
+    light, transport, protocol = ready_light
 
-@pytest.mark.asyncio
-async def test_async_set_brightness_rgbw(mock_aio_protocol):
-    """Test we can set brightness with a rgbw only device."""
-    light = AIOWifiLedBulb("192.168.1.166")
+    await light.async_stop()
 
-    def _updated_callback(*args, **kwargs):
-        pass
 
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x04\x10\xb6\x00\x98\x19\x04\x25\x0f\xdd"
-    )
-    await task
+@pytest.mark.parametrize(
+    "ready_light, write_255, write_128",
+    [
+        pytest.param(
+            STATE_0X25_ON,
+            b"1\xff\x00\xd5\xff\xff\x00\x0f\x12",
+            b"1\x80\x00k\x80\x80\x00\x0f+",
+            id="rgbww",
+        ),
+        pytest.param(
+            _with_checksum(b"\x81\x25\x23\x61\x02\x10\xb6\x00\x98\x19\x04\x25\x0f"),
+            b"1\x00\x00\x00g\x98\x00\x0f?",
+            b"1\x00\x00\x004L\x00\x0f\xc0",
+            id="cct_0x25",
+        ),
+        pytest.param(
+            _with_checksum(b"\x81\x07\x24\x61\xc7\x01\x00\x00\x00\x00\x02\xff\x0f"),
+            b"1\x00\x00\x00\x00\xff\x0f\x0fN",
+            b"1\x00\x00\x00\x00\x80\x0f\x0f\xcf",
+            id="cct_0x07",
+        ),
+        pytest.param(
+            _with_checksum(b"\x81\x25\x23\x61\x01\x10\xb6\x00\x98\x19\x04\x25\x0f"),
+            b"1\x00\x00\x00\xff\xff\x00\x0f>",
+            b"1\x00\x00\x00\x80\x80\x00\x0f@",
+            id="dim",
+        ),
+        pytest.param(
+            _with_checksum(b"\x81\x33\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f"),
+            b"1\xff\x00\xd4\x00\x00\x0f\x13",
+            b"1\x80\x00j\x00\x00\x0f*",
+            id="rgb_0x33",
+        ),
+        pytest.param(
+            _with_checksum(b"\x81\x25\x23\x61\x03\x10\xb6\x00\x98\x19\x04\x25\x0f"),
+            b"1\xff\x00\xd4\x00\x00\x00\x0f\x13",
+            b"1\x80\x00j\x00\x00\x00\x0f*",
+            id="rgb_0x25",
+        ),
+        pytest.param(
+            _with_checksum(b"\x81\x25\x23\x61\x04\x10\xb6\x00\x98\x19\x04\x25\x0f"),
+            b"1\xff\x00\xd5\xff\xff\x00\x0f\x12",
+            b"1\x80\x00k\x80\x80\x00\x0f+",
+            id="rgbw",
+        ),
+    ],
+    indirect=["ready_light"],
+)
+async def test_async_set_brightness(ready_light, write_255, write_128):
+    """Test we can set brightness for each color mode."""
+    light, transport, protocol = ready_light
 
     transport.reset_mock()
     await light.async_set_brightness(255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\xff\x00\xd5\xff\xff\x00\x0f\x12"
+    assert transport.mock_calls[0] == call.write(write_255)
     assert light.brightness == 255
 
     transport.reset_mock()
     await light.async_set_brightness(128)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x80\x00k\x80\x80\x00\x0f+"
+    assert transport.mock_calls[0] == call.write(write_128)
     assert light.brightness == 128
 
 
-@pytest.mark.asyncio
-async def test_0x06_rgbw_cct_warm(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+async def test_0x06_rgbw_cct_warm(mock_aio_protocol):
     """Test we can set CCT on RGBW with a warm strip."""
     light = AIOWifiLedBulb("192.168.1.166")
     assert light.white_channel_channel_type == WhiteChannelType.WARM
     light.white_channel_channel_type = WhiteChannelType.WARM
     assert light.white_channel_channel_type == WhiteChannelType.WARM
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x06\x24\x61\x24\x01\x00\xff\x00\x00\x03\x00\xf0\x23"
-    )
+    light._aio_protocol.data_received(STATE_0X06_OFF)
     await task
     assert light.model_num == 0x06
     assert light.operating_mode == "RGB&W"
@@ -2084,8 +1674,7 @@ async def test_0x06_rgbw_cct_warm(mock_aio_protocol, caplog: pytest.LogCaptureFi
 
     transport.reset_mock()
     await light.async_set_white_temp(light.max_temp, 255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\xff\xff\xff\x00\x00\x0f="
+    assert transport.mock_calls[0] == call.write(b"1\xff\xff\xff\x00\x00\x0f=")
     assert light.brightness == 255
     assert light.raw_state.red == 255
     assert light.raw_state.green == 255
@@ -2094,8 +1683,7 @@ async def test_0x06_rgbw_cct_warm(mock_aio_protocol, caplog: pytest.LogCaptureFi
 
     transport.reset_mock()
     await light.async_set_white_temp(light.min_temp, 255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x00\x00\x00\xff\x00\x0f?"
+    assert transport.mock_calls[0] == call.write(b"1\x00\x00\x00\xff\x00\x0f?")
     assert light.brightness == 255
     assert light.raw_state.red == 0
     assert light.raw_state.green == 0
@@ -2103,23 +1691,15 @@ async def test_0x06_rgbw_cct_warm(mock_aio_protocol, caplog: pytest.LogCaptureFi
     assert light.raw_state.warm_white == 255
 
 
-@pytest.mark.asyncio
-async def test_0x06_rgbw_cct_natural(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_0x06_rgbw_cct_natural(mock_aio_protocol):
     """Test we can set CCT on RGBW with a natural strip."""
     light = AIOWifiLedBulb("192.168.1.166")
     light.white_channel_channel_type = WhiteChannelType.NATURAL
     assert light.white_channel_channel_type == WhiteChannelType.NATURAL
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x06\x24\x61\x24\x01\x00\xff\x00\x00\x03\x00\xf0\x23"
-    )
+    light._aio_protocol.data_received(STATE_0X06_OFF)
     await task
     assert light.model_num == 0x06
     assert light.operating_mode == "RGB&W"
@@ -2129,8 +1709,7 @@ async def test_0x06_rgbw_cct_natural(
 
     transport.reset_mock()
     await light.async_set_white_temp(light.max_temp, 255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\xff\xff\xff\x00\x00\x0f="
+    assert transport.mock_calls[0] == call.write(b"1\xff\xff\xff\x00\x00\x0f=")
     assert light.brightness == 255
     assert light.raw_state.red == 255
     assert light.raw_state.blue == 255
@@ -2139,8 +1718,7 @@ async def test_0x06_rgbw_cct_natural(
 
     transport.reset_mock()
     await light.async_set_white_temp(light.min_temp, 255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x00\x00\x00\xff\x00\x0f?"
+    assert transport.mock_calls[0] == call.write(b"1\x00\x00\x00\xff\x00\x0f?")
     assert light.brightness == 255
     assert light.raw_state.red == 0
     assert light.raw_state.blue == 0
@@ -2148,21 +1726,15 @@ async def test_0x06_rgbw_cct_natural(
     assert light.raw_state.warm_white == 255
 
 
-@pytest.mark.asyncio
-async def test_0x06_rgbw_cct_cold(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+async def test_0x06_rgbw_cct_cold(mock_aio_protocol):
     """Test we can set CCT on RGBW with a cold strip."""
     light = AIOWifiLedBulb("192.168.1.166")
     light.white_channel_channel_type = WhiteChannelType.COLD
     assert light.white_channel_channel_type == WhiteChannelType.COLD
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x06\x24\x61\x24\x01\x00\xff\x00\x00\x03\x00\xf0\x23"
-    )
+    light._aio_protocol.data_received(STATE_0X06_OFF)
     await task
     assert light.model_num == 0x06
     assert light.operating_mode == "RGB&W"
@@ -2171,21 +1743,15 @@ async def test_0x06_rgbw_cct_cold(mock_aio_protocol, caplog: pytest.LogCaptureFi
     assert light.max_temp == MAX_TEMP
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(sys.version_info[:3][1] in (7,), reason="no AsyncMock in 3.7")
-async def test_wrapped_cct_protocol_device(mock_aio_protocol):
+@pytest.mark.parametrize(
+    "ready_light",
+    [STATE_0X1C_ON],
+    indirect=True,
+)
+async def test_wrapped_cct_protocol_device(ready_light):
     """Test a wrapped cct protocol device."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, original_aio_protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x1c\x23\x61\x00\x05\x00\x64\x64\x64\x03\x64\x0f\xc8"
-    )
-    await task
+    light, transport, original_aio_protocol = ready_light
     assert light.getCCT() == (0, 255)
     assert light.color_temp == 6500
     assert light.brightness == 255
@@ -2206,37 +1772,29 @@ async def test_wrapped_cct_protocol_device(mock_aio_protocol):
 
     transport.reset_mock()
     await light.async_set_brightness(32)
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x00\x00\t5\xb1\x00\r\x00\x00\x00\x03\xf6\xbd"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x00\x00\t5\xb1\x00\r\x00\x00\x00\x03\xf6\xbd"
     )
     assert light.brightness == 33
 
     transport.reset_mock()
     await light.async_set_brightness(128)
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\t5\xb1\x002\x00\x00\x00\x03\x1b\x08"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\t5\xb1\x002\x00\x00\x00\x03\x1b\x08"
     )
     assert light.brightness == 128
 
     transport.reset_mock()
     await light.async_set_brightness(1)
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x02\x00\t5\xb1\x00\x02\x00\x00\x00\x03\xeb\xa9"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x02\x00\t5\xb1\x00\x02\x00\x00\x00\x03\xeb\xa9"
     )
     assert light.brightness == 0
 
     transport.reset_mock()
     await light.async_set_levels(w=0, w2=255)
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\t5\xb1dd\x00\x00\x00\x03\xb16"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\t5\xb1dd\x00\x00\x00\x03\xb16"
     )
     assert light.getCCT() == (0, 255)
     assert light.color_temp == 6500
@@ -2245,38 +1803,31 @@ async def test_wrapped_cct_protocol_device(mock_aio_protocol):
     transport.reset_mock()
     await light.async_set_effect("random", 50)
     assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0].startswith(b"\xb0\xb1\xb2\xb3\x00")
+    assert transport.mock_calls[0][1][0].startswith(OUTER_MESSAGE_PREFIX)
 
     # light is on
-    light._aio_protocol.data_received(
-        b"\x81\x1c\x23\x61\x00\x05\x00\x64\x64\x64\x03\x64\x0f\xc8"
-    )
+    light._aio_protocol.data_received(STATE_0X1C_ON)
     assert light._last_update_time == aiodevice.NEVER_TIME
     transport.reset_mock()
     await light.async_update()
     await light.async_update()
     await light.async_update()
     await light.async_update()
-    await asyncio.sleep(0)
     assert len(transport.mock_calls) == 1
 
     # light is off
-    light._aio_protocol.data_received(
-        b"\x81\x1c\x24\x61\x00\x05\x00\x64\x64\x64\x03\x64\x0f\xc9"
-    )
+    light._aio_protocol.data_received(STATE_0X1C_OFF)
     transport.reset_mock()
     await light.async_update()
     await light.async_update()
     await light.async_update()
     await light.async_update()
-    await asyncio.sleep(0)
     assert len(transport.mock_calls) == 0
 
     transport.reset_mock()
     for _ in range(4):
         light._last_update_time = aiodevice.NEVER_TIME
         await light.async_update()
-    await asyncio.sleep(0)
     assert len(transport.mock_calls) == 4
 
     light._last_update_time = aiodevice.NEVER_TIME
@@ -2295,27 +1846,19 @@ async def test_wrapped_cct_protocol_device(mock_aio_protocol):
     light._aio_protocol = original_aio_protocol
     # Should not raise now that bulb has recovered
     light._last_update_time = aiodevice.NEVER_TIME
-    light._aio_protocol.data_received(
-        b"\x81\x1c\x24\x61\x00\x05\x00\x64\x64\x64\x03\x64\x0f\xc9"
-    )
+    light._aio_protocol.data_received(STATE_0X1C_OFF)
     await light.async_update()
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(sys.version_info[:3][1] in (7,), reason="no AsyncMock in 3.7")
-async def test_cct_protocol_device(mock_aio_protocol):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\x09\x23\x61\x00\x05\x00\x64\x64\x64\x03\x64\x0f\xb5"],
+    indirect=True,
+)
+async def test_cct_protocol_device(ready_light):
     """Test a original cct protocol device."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, original_aio_protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x09\x23\x61\x00\x05\x00\x64\x64\x64\x03\x64\x0f\xb5"
-    )
-    await task
+    light, transport, original_aio_protocol = ready_light
     assert light.getCCT() == (0, 255)
     assert light.color_temp == 6500
     assert light.brightness == 255
@@ -2336,26 +1879,22 @@ async def test_cct_protocol_device(mock_aio_protocol):
 
     transport.reset_mock()
     await light.async_set_brightness(32)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"5\xb1\x00\r\x00\x00\x00\x03\xf6"
+    assert transport.mock_calls[0] == call.write(b"5\xb1\x00\r\x00\x00\x00\x03\xf6")
     assert light.brightness == 33
 
     transport.reset_mock()
     await light.async_set_brightness(128)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"5\xb1\x002\x00\x00\x00\x03\x1b"
+    assert transport.mock_calls[0] == call.write(b"5\xb1\x002\x00\x00\x00\x03\x1b")
     assert light.brightness == 128
 
     transport.reset_mock()
     await light.async_set_brightness(1)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"5\xb1\x00\x02\x00\x00\x00\x03\xeb"
+    assert transport.mock_calls[0] == call.write(b"5\xb1\x00\x02\x00\x00\x00\x03\xeb")
     assert light.brightness == 0
 
     transport.reset_mock()
     await light.async_set_levels(w=0, w2=255)
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"5\xb1dd\x00\x00\x00\x03\xb1"
+    assert transport.mock_calls[0] == call.write(b"5\xb1dd\x00\x00\x00\x03\xb1")
     assert light.getCCT() == (0, 255)
     assert light.color_temp == 6500
     assert light.brightness == 255
@@ -2366,35 +1905,28 @@ async def test_cct_protocol_device(mock_aio_protocol):
     assert transport.mock_calls[0][1][0].startswith(b"5\xb1")
 
     # light is on
-    light._aio_protocol.data_received(
-        b"\x81\x1c\x23\x61\x00\x05\x00\x64\x64\x64\x03\x64\x0f\xc8"
-    )
+    light._aio_protocol.data_received(STATE_0X1C_ON)
     assert light._last_update_time == aiodevice.NEVER_TIME
     transport.reset_mock()
     await light.async_update()
     await light.async_update()
     await light.async_update()
     await light.async_update()
-    await asyncio.sleep(0)
     assert len(transport.mock_calls) == 1
 
     # light is off
-    light._aio_protocol.data_received(
-        b"\x81\x1c\x24\x61\x00\x05\x00\x64\x64\x64\x03\x64\x0f\xc9"
-    )
+    light._aio_protocol.data_received(STATE_0X1C_OFF)
     transport.reset_mock()
     await light.async_update()
     await light.async_update()
     await light.async_update()
     await light.async_update()
-    await asyncio.sleep(0)
     assert len(transport.mock_calls) == 0
 
     transport.reset_mock()
     for _ in range(4):
         light._last_update_time = aiodevice.NEVER_TIME
         await light.async_update()
-    await asyncio.sleep(0)
     assert len(transport.mock_calls) == 4
 
     light._last_update_time = aiodevice.NEVER_TIME
@@ -2414,26 +1946,18 @@ async def test_cct_protocol_device(mock_aio_protocol):
 
     # Should not raise now that bulb has recovered
     light._last_update_time = aiodevice.NEVER_TIME
-    light._aio_protocol.data_received(
-        b"\x81\x1c\x24\x61\x00\x05\x00\x64\x64\x64\x03\x64\x0f\xc9"
-    )
+    light._aio_protocol.data_received(STATE_0X1C_OFF)
     await light.async_update()
 
 
-@pytest.mark.asyncio
-async def test_christmas_protocol_device_turn_on(mock_aio_protocol):
+@pytest.mark.parametrize(
+    "ready_light",
+    [STATE_0X1A_ON],
+    indirect=True,
+)
+async def test_christmas_protocol_device_turn_on(ready_light):
     """Test a christmas protocol device."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x1a\x23\x61\x00\x00\x00\xff\x00\x00\x01\x00\x06\x25"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.rgb == (0, 255, 0)
     assert light.brightness == 255
     assert len(light.effect_list) == 101
@@ -2455,11 +1979,10 @@ async def test_christmas_protocol_device_turn_on(mock_aio_protocol):
         patch.object(light._aio_protocol, "write", _send_data),
     ):
         data = [
-            b"\x81\x1a\x23\x61\x00\x00\x00\xff\x00\x00\x01\x00\x06\x25",
-            b"\x81\x25\x24\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xdf",
+            STATE_0X1A_ON,
+            STATE_0X25_OFF,
         ]
         await light.async_turn_off()
-        await asyncio.sleep(0)
         assert light.is_on is False
         assert len(data) == 0
 
@@ -2469,20 +1992,14 @@ async def test_christmas_protocol_device_turn_on(mock_aio_protocol):
     ]
 
 
-@pytest.mark.asyncio
-async def test_christmas_protocol_device(mock_aio_protocol):
+@pytest.mark.parametrize(
+    "ready_light",
+    [STATE_0X1A_ON],
+    indirect=True,
+)
+async def test_christmas_protocol_device(ready_light):
     """Test a christmas protocol device."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x1a\x23\x61\x00\x00\x00\xff\x00\x00\x01\x00\x06\x25"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.rgb == (0, 255, 0)
     assert light.brightness == 255
     assert len(light.effect_list) == 101
@@ -2494,37 +2011,29 @@ async def test_christmas_protocol_device(mock_aio_protocol):
 
     transport.reset_mock()
     await light.async_set_brightness(255)
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x00\x00\x0d\x3b\xa1<dd\x00\x00\x00\x00\x00\x00\x00\xe0\x95"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x00\x00\x0d\x3b\xa1<dd\x00\x00\x00\x00\x00\x00\x00\xe0\x95"
     )
     assert light.brightness == 255
 
     transport.reset_mock()
     await light.async_set_brightness(128)
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\r;\xa1<d2\x00\x00\x00\x00\x00\x00\x00\xae2"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\r;\xa1<d2\x00\x00\x00\x00\x00\x00\x00\xae2"
     )
     assert light.brightness == 128
 
     transport.reset_mock()
     await light.async_set_levels(r=255, g=255, b=255)
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x02\x00\r;\xa1\x00\x00\x64\x00\x00\x00\x00\x00\x00\x00@W"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x02\x00\r;\xa1\x00\x00\x64\x00\x00\x00\x00\x00\x00\x00@W"
     )
     assert light.brightness == 255
 
     transport.reset_mock()
     await light.async_set_effect("Twinkle Green", 50)
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\x048\n\x10Rs"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\x048\n\x10Rs"
     )
     light._transition_complete_time = 0
     light._aio_protocol.data_received(
@@ -2535,10 +2044,8 @@ async def test_christmas_protocol_device(mock_aio_protocol):
 
     transport.reset_mock()
     await light.async_set_effect("Strobe Red, Green", 100)
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x04\x00\x048=\x01v\xbc"
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x04\x00\x048=\x01v\xbc"
     )
 
     light._transition_complete_time = 0
@@ -2561,8 +2068,7 @@ async def test_christmas_protocol_device(mock_aio_protocol):
 
     transport.reset_mock()
     await light.async_set_zones([(255, 0, 0), (0, 0, 255)])
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == (
+    assert transport.mock_calls[0] == call.write(
         b"\xb0\xb1\xb2\xb3\x00\x01\x01\x05\x004\xa0\x00\x06\x00\x01\xff"
         b"\x00\x00\x00\x00\xff\x00\x02\xff\x00\x00\x00\x00\xff\x00\x03\xff"
         b"\x00\x00\x00\x00\xff\x00\x04\x00\x00\xff\x00\x00\xff\x00\x05\x00"
@@ -2573,8 +2079,7 @@ async def test_christmas_protocol_device(mock_aio_protocol):
     await light.async_set_zones(
         [(255, 0, 0), (0, 0, 255), (0, 255, 0), (255, 255, 255)]
     )
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == (
+    assert transport.mock_calls[0] == call.write(
         b"\xb0\xb1\xb2\xb3\x00\x01\x01\x06\x004\xa0\x00\x06\x00\x01\xff"
         b"\x00\x00\x00\x00\xff\x00\x02\x00\x00\xff\x00\x00\xff\x00\x03\x00"
         b"\xff\x00\x00\x00\xff\x00\x04\xff\xff\xff\x00\x00\xff\x00\x05\xff"
@@ -2595,21 +2100,9 @@ async def test_christmas_protocol_device(mock_aio_protocol):
         )
 
 
-@pytest.mark.asyncio
-async def test_async_get_time(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+async def test_async_get_time(ready_light):
     """Test we can get the time."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    # ic state
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x25
     task = asyncio.ensure_future(light.async_get_time())
     await asyncio.sleep(0)
@@ -2621,19 +2114,13 @@ async def test_async_get_time(mock_aio_protocol, caplog: pytest.LogCaptureFixtur
     assert light._protocol.parse_get_time(b"\x0f") is None
 
 
-@pytest.mark.asyncio
-async def test_async_get_times_out(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+async def test_async_get_times_out(mock_aio_protocol):
     """Test we can get the time."""
     light = AIOWifiLedBulb("192.168.1.166", timeout=0.001)
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
+    light._aio_protocol.data_received(STATE_0X25_ON)
     # ic state
     await task
     assert light.model_num == 0x25
@@ -2643,29 +2130,15 @@ async def test_async_get_times_out(mock_aio_protocol, caplog: pytest.LogCaptureF
     assert time is None
 
 
-@pytest.mark.asyncio
-async def test_async_set_time(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+async def test_async_set_time(ready_light):
     """Test we can set the time."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    # ic state
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x25
 
     transport.reset_mock()
     await light.async_set_time(datetime.datetime(2020, 1, 1, 1, 1, 1))
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"\x10\x14\x14\x01\x01\x01\x01\x01\x03\x00\x0fO"
+    assert transport.mock_calls[0] == call.write(
+        b"\x10\x14\x14\x01\x01\x01\x01\x01\x03\x00\x0fO"
     )
 
     transport.reset_mock()
@@ -2674,18 +2147,12 @@ async def test_async_set_time(mock_aio_protocol, caplog: pytest.LogCaptureFixtur
     assert transport.mock_calls[0][1][0].startswith(b"\x10")
 
 
-@pytest.mark.asyncio
-async def test_async_set_time_legacy_device(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_async_set_time_legacy_device(mock_aio_protocol):
     """Test we can set the time on a legacy device."""
     light = AIOWifiLedBulb("192.168.1.166")
     light.discovery = FLUX_DISCOVERY_LEGACY
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     transport, protocol = await mock_aio_protocol()
     light._aio_protocol.data_received(b"f\x03$A!\x08\x01\x19P\x01\x99")
     # ic state
@@ -2694,9 +2161,8 @@ async def test_async_set_time_legacy_device(
 
     transport.reset_mock()
     await light.async_set_time(datetime.datetime(2020, 1, 1, 1, 1, 1))
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0] == b"\x10\x14\x14\x01\x01\x01\x01\x01\x03\x00\x0f"
+    assert transport.mock_calls[0] == call.write(
+        b"\x10\x14\x14\x01\x01\x01\x01\x01\x03\x00\x0f"
     )
 
     transport.reset_mock()
@@ -2705,22 +2171,9 @@ async def test_async_set_time_legacy_device(
     assert transport.mock_calls[0][1][0].startswith(b"\x10")
 
 
-@pytest.mark.asyncio
-async def test_async_get_timers_9byte_device(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_async_get_timers_9byte_device(ready_light):
     """Test we can get the timers from a 9 byte device."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x25
     task = asyncio.ensure_future(light.async_get_timers())
     await asyncio.sleep(0)
@@ -2757,24 +2210,14 @@ async def test_async_get_timers_9byte_device(
         light._protocol.parse_get_timers(b"\x0f")
 
 
-@pytest.mark.asyncio
-async def test_async_get_timers_socket_device(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+@pytest.mark.parametrize(
+    "ready_light",
+    [STATE_0X97_ON + b"\xf0\x32\xf0\xf0\xf0\xf0\xe2"],
+    indirect=True,
+)
+async def test_async_get_timers_socket_device(ready_light):
     """Test we can get the timers."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x97\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\x50"
-    )
-    light._aio_protocol.data_received(b"\xf0\x32\xf0\xf0\xf0\xf0\xe2")
-
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x97
     task = asyncio.ensure_future(light.async_get_timers())
     await asyncio.sleep(0)
@@ -2791,46 +2234,27 @@ async def test_async_get_timers_socket_device(
     assert str(timers[3]) == "[ON ] 17:48  SuMoTuWeThFrSa    "
 
 
-@pytest.mark.asyncio
-async def test_sockets_push_updates(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+@pytest.mark.parametrize(
+    "ready_light",
+    [STATE_0X97_ON + b"\xf0\x32\xf0\xf0\xf0\xf0\xe2"],
+    indirect=True,
+)
+async def test_sockets_push_updates(ready_light):
     """Test we can get the timers."""
-    socket = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(socket.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    socket._aio_protocol.data_received(
-        b"\x81\x97\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\x50"
-    )
-    socket._aio_protocol.data_received(b"\xf0\x32\xf0\xf0\xf0\xf0\xe2")
-
-    await task
+    socket, transport, protocol = ready_light
     assert socket.model_num == 0x97
     assert socket._protocol.power_push_updates is True
     assert socket._protocol.state_push_updates is True
 
 
-@pytest.mark.asyncio
-async def test_async_get_timers_8_byte_device(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\x33\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xec"],
+    indirect=True,
+)
+async def test_async_get_timers_8_byte_device(ready_light):
     """Test we can get the timers from an 8 byte device."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x33\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xec"
-    )
-
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x33
     task = asyncio.ensure_future(light.async_get_timers())
     await asyncio.sleep(0)
@@ -2847,21 +2271,13 @@ async def test_async_get_timers_8_byte_device(
     assert str(timers[0]) == "Unset"
 
 
-@pytest.mark.asyncio
-async def test_async_get_timers_times_out(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_async_get_timers_times_out(mock_aio_protocol):
     """Test getting timers times out."""
     light = AIOWifiLedBulb("192.168.1.166", timeout=0.001)
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
+    light._aio_protocol.data_received(STATE_0X25_ON)
     # ic state
     await task
     assert light.model_num == 0x25
@@ -2871,30 +2287,17 @@ async def test_async_get_timers_times_out(
     assert time is None
 
 
-@pytest.mark.asyncio
-async def test_async_set_timers(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+async def test_async_set_timers(ready_light, caplog: pytest.LogCaptureFixture):
     """Test we can set timers."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.model_num == 0x25
 
     transport.reset_mock()
     await light.async_set_timers(
         [LedTimer(b"\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\xf0") for _ in range(6)]
     )
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"!\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\x00\xf0a"
+    assert transport.mock_calls[0] == call.write(
+        b"!\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\x00\xf0a"
     )
 
     caplog.clear()
@@ -2902,10 +2305,8 @@ async def test_async_set_timers(mock_aio_protocol, caplog: pytest.LogCaptureFixt
     await light.async_set_timers(
         [LedTimer(b"\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\xf0") for _ in range(7)]
     )
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"!\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\x00\xf0a"
+    assert transport.mock_calls[0] == call.write(
+        b"!\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\x00\xf0a"
     )
     assert "too many timers, truncating list" in caplog.text
 
@@ -2913,103 +2314,70 @@ async def test_async_set_timers(mock_aio_protocol, caplog: pytest.LogCaptureFixt
     await light.async_set_timers(
         [LedTimer(b"\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\xf0") for _ in range(2)]
     )
-    assert transport.mock_calls[0][0] == "write"
-    assert (
-        transport.mock_calls[0][1][0]
-        == b"!\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xbd"
+    assert transport.mock_calls[0] == call.write(
+        b"!\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x0c-\x00>a\x00\x80\x00\x00\x00\xf0\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xbd"
     )
 
 
-@pytest.mark.asyncio
-async def test_async_enable_remote_access(mock_aio_protocol):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\x25\x23\x61\x04\x10\xb6\x00\x98\x19\x04\x25\x0f\xdd"],
+    indirect=True,
+)
+async def test_async_enable_remote_access(ready_light):
     """Test we can enable remote access."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x04\x10\xb6\x00\x98\x19\x04\x25\x0f\xdd"
-    )
-    await task
+    light, transport, protocol = ready_light
 
     with patch(
         "flux_led.aiodevice.AIOBulbScanner.async_enable_remote_access",
-        return_value=mock_coro(True),
+        return_value=True,
     ) as mock_async_enable_remote_access:
         await light.async_enable_remote_access("host", 1234)
 
     assert mock_async_enable_remote_access.mock_calls == [
         call("192.168.1.166", "host", 1234)
-    ]
-
-
-@pytest.mark.asyncio
-async def test_async_disable_remote_access(mock_aio_protocol):
-    """Test we can disable remote access."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x04\x10\xb6\x00\x98\x19\x04\x25\x0f\xdd"
-    )
-    await task
+    ]
+
+
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\x25\x23\x61\x04\x10\xb6\x00\x98\x19\x04\x25\x0f\xdd"],
+    indirect=True,
+)
+async def test_async_disable_remote_access(ready_light):
+    """Test we can disable remote access."""
+    light, transport, protocol = ready_light
 
     with patch(
         "flux_led.aiodevice.AIOBulbScanner.async_disable_remote_access",
-        return_value=mock_coro(True),
+        return_value=True,
     ) as mock_async_disable_remote_access:
         await light.async_disable_remote_access()
 
     assert mock_async_disable_remote_access.mock_calls == [call("192.168.1.166")]
 
 
-@pytest.mark.asyncio
-async def test_async_reboot(mock_aio_protocol):
+@pytest.mark.parametrize(
+    "ready_light",
+    [b"\x81\x25\x23\x61\x04\x10\xb6\x00\x98\x19\x04\x25\x0f\xdd"],
+    indirect=True,
+)
+async def test_async_reboot(ready_light):
     """Test we can reboot."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x04\x10\xb6\x00\x98\x19\x04\x25\x0f\xdd"
-    )
-    await task
+    light, transport, protocol = ready_light
 
     with patch(
         "flux_led.aiodevice.AIOBulbScanner.async_reboot",
-        return_value=mock_coro(True),
+        return_value=True,
     ) as mock_async_reboot:
         await light.async_reboot()
 
     assert mock_async_reboot.mock_calls == [call("192.168.1.166")]
 
 
-@pytest.mark.asyncio
-async def test_power_state_response_processing(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_power_state_response_processing(ready_light):
     """Test we can turn on and off via power state message."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    await task
+    light, _, _ = ready_light
     light._aio_protocol.data_received(b"\xf0\x32\xf0\xf0\xf0\xf0\xe2")
     assert light.power_restore_states == PowerRestoreStates(
         channel1=PowerRestoreState.LAST_STATE,
@@ -3033,24 +2401,14 @@ async def test_power_state_response_processing(
     )
 
 
-@pytest.mark.asyncio
-async def test_async_set_power_restore_state(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+@pytest.mark.parametrize(
+    "ready_light",
+    [STATE_0X97_OFF + b"\x0f\x32\xf0\xf0\xf0\xf0\x01"],
+    indirect=True,
+)
+async def test_async_set_power_restore_state(ready_light):
     """Test we can set power restore state and report it."""
-    socket = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(socket.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    socket._aio_protocol.data_received(
-        b"\x81\x97\x24\x24\x00\x00\x00\x00\x00\x00\x02\x00\x00\x62"
-    )
-    # power restore state
-    socket._aio_protocol.data_received(b"\x0f\x32\xf0\xf0\xf0\xf0\x01")
-    await task
+    socket, transport, protocol = ready_light
     assert socket.model_num == 0x97
     assert socket.power_restore_states == PowerRestoreStates(
         channel1=PowerRestoreState.LAST_STATE,
@@ -3066,210 +2424,121 @@ async def test_async_set_power_restore_state(
         channel3=PowerRestoreState.ALWAYS_ON,
         channel4=PowerRestoreState.ALWAYS_ON,
     )
-    assert transport.mock_calls[0][0] == "write"
-    assert transport.mock_calls[0][1][0] == b"1\x0f\x0f\x0f\x0f\xf0]"
+    assert transport.mock_calls[0] == call.write(b"1\x0f\x0f\x0f\x0f\xf0]")
 
 
-@pytest.mark.asyncio
-async def test_async_set_power_restore_state_fails(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_async_set_power_restore_state_fails(mock_aio_protocol):
     """Test we raise if we do not get a power restore state."""
     socket = AIOWifiLedBulb("192.168.1.166", timeout=0.01)
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(socket.async_setup(_updated_callback))
+    task = asyncio.create_task(socket.async_setup(_noop_callback))
     transport, protocol = await mock_aio_protocol()
-    socket._aio_protocol.data_received(
-        b"\x81\x97\x24\x24\x00\x00\x00\x00\x00\x00\x02\x00\x00\x62"
-    )
+    socket._aio_protocol.data_received(STATE_0X97_OFF)
     # power restore state not sent
     with pytest.raises(RuntimeError):
         await task
 
 
-@pytest.mark.asyncio
-async def test_remote_config_queried(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_remote_config_queried(mock_aio_protocol, no_device_config_wait):
     """Test power state is queried if discovery shows a compatible remote."""
     light = AIOWifiLedBulb("192.168.1.166")
     light.discovery = FLUX_DISCOVERY_24G_REMOTE
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    with patch.object(aiodevice, "DEVICE_CONFIG_WAIT_SECONDS", 0):
-        task = asyncio.create_task(light.async_setup(_updated_callback))
-        transport, protocol = await mock_aio_protocol()
-        light._aio_protocol.data_received(
-            b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-        )
-        light._aio_protocol.data_received(
-            b"\xb0\xb1\xb2\xb3\x00\x01\x01\x5e\x00\x0e\x2b\x01\x00\x00\x00\x00\x29\x00\x00\x00\x00\x00\x00\x55\xde"
-        )
-        await task
+    task = asyncio.create_task(light.async_setup(_noop_callback))
+    transport, protocol = await mock_aio_protocol()
+    light._aio_protocol.data_received(STATE_0X25_ON + REMOTE_CONFIG_DISABLED)
+    await task
 
-        assert light.remote_config == RemoteConfig.DISABLED
-        assert light.paired_remotes == 0
-        assert transport.mock_calls == [
-            call.get_extra_info("peername"),
-            call.write(bytearray(b"\x81\x8a\x8b\x96")),
-            call.write(
-                bytearray(b"\xb0\xb1\xb2\xb3\x00\x01\x01\x00\x00\x04+,-\x84\xd4")
-            ),
-        ]
+    assert light.remote_config == RemoteConfig.DISABLED
+    assert light.paired_remotes == 0
+    assert transport.mock_calls == [
+        call.get_extra_info("peername"),
+        call.write(b"\x81\x8a\x8b\x96"),
+        call.write(b"\xb0\xb1\xb2\xb3\x00\x01\x01\x00\x00\x04+,-\x84\xd4"),
+    ]
 
 
-@pytest.mark.asyncio
 async def test_remote_config_response_processing(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
+    mock_aio_protocol, no_device_config_wait
 ):
     """Test we can turn on and off via power state message."""
     light = AIOWifiLedBulb("192.168.1.166")
     light.discovery = FLUX_DISCOVERY_24G_REMOTE
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    with patch.object(aiodevice, "DEVICE_CONFIG_WAIT_SECONDS", 0):
-        task = asyncio.create_task(light.async_setup(_updated_callback))
-        await mock_aio_protocol()
-        light._aio_protocol.data_received(
-            b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-        )
-        light._aio_protocol.data_received(
-            b"\xb0\xb1\xb2\xb3\x00\x01\x01\x5e\x00\x0e\x2b\x01\x00\x00\x00\x00\x29\x00\x00\x00\x00\x00\x00\x55\xde"
-        )
-
-        await task
-        light._aio_protocol.data_received(
-            b"\xb0\xb1\xb2\xb3\x00\x01\x01\x5e\x00\x0e\x2b\x01\x00\x00\x00\x00\x29\x00\x00\x00\x00\x00\x00\x55\xde"
-        )
-        assert light.remote_config == RemoteConfig.DISABLED
-        assert light.paired_remotes == 0
+    task = asyncio.create_task(light.async_setup(_noop_callback))
+    await mock_aio_protocol()
+    light._aio_protocol.data_received(STATE_0X25_ON + REMOTE_CONFIG_DISABLED)
+    await task
+    light._aio_protocol.data_received(REMOTE_CONFIG_DISABLED)
+    assert light.remote_config == RemoteConfig.DISABLED
+    assert light.paired_remotes == 0
 
-        light._aio_protocol.data_received(
-            b"\xb0\xb1\xb2\xb3\x00\x01\x01\x45\x00\x0e\x2b\x02\x00\x00\x00\x00\x29\x00\x00\x00\x00\x00\x00\x56\xc7"
-        )
-        assert light.remote_config == RemoteConfig.OPEN
-        assert light.paired_remotes == 0
+    light._aio_protocol.data_received(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x45\x00\x0e\x2b\x02\x00\x00\x00\x00\x29\x00\x00\x00\x00\x00\x00\x56\xc7"
+    )
+    assert light.remote_config == RemoteConfig.OPEN
+    assert light.paired_remotes == 0
 
-        light._aio_protocol.data_received(
-            b"\xb0\xb1\xb2\xb3\x00\x01\x01\xe3\x00\x0e\x2b\x03\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x19"
-        )
-        assert light.remote_config == RemoteConfig.PAIRED_ONLY
-        assert light.paired_remotes == 2
+    light._aio_protocol.data_received(REMOTE_CONFIG_PAIRED_ONLY)
+    assert light.remote_config == RemoteConfig.PAIRED_ONLY
+    assert light.paired_remotes == 2
 
 
-@pytest.mark.asyncio
-async def test_async_config_remotes(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_async_config_remotes(mock_aio_protocol, no_device_config_wait):
     """Test we can configure remotes."""
     light = AIOWifiLedBulb("192.168.1.166")
     light.discovery = FLUX_DISCOVERY_24G_REMOTE
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    with patch.object(aiodevice, "DEVICE_CONFIG_WAIT_SECONDS", 0):
-        task = asyncio.create_task(light.async_setup(_updated_callback))
-        transport, protocol = await mock_aio_protocol()
-        light._aio_protocol.data_received(
-            b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-        )
-        light._aio_protocol.data_received(
-            b"\xb0\xb1\xb2\xb3\x00\x01\x01\x5e\x00\x0e\x2b\x01\x00\x00\x00\x00\x29\x00\x00\x00\x00\x00\x00\x55\xde"
-        )
-
-        await task
-        light._aio_protocol.data_received(
-            b"\xb0\xb1\xb2\xb3\x00\x01\x01\xe3\x00\x0e\x2b\x03\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x19"
-        )
-        assert light.remote_config == RemoteConfig.PAIRED_ONLY
-        assert light.paired_remotes == 2
+    task = asyncio.create_task(light.async_setup(_noop_callback))
+    transport, protocol = await mock_aio_protocol()
+    light._aio_protocol.data_received(STATE_0X25_ON + REMOTE_CONFIG_DISABLED)
+    await task
+    light._aio_protocol.data_received(REMOTE_CONFIG_PAIRED_ONLY)
+    assert light.remote_config == RemoteConfig.PAIRED_ONLY
+    assert light.paired_remotes == 2
 
-        transport.reset_mock()
-        await light.async_config_remotes(RemoteConfig.DISABLED)
-        assert transport.mock_calls[0][0] == "write"
-        assert (
-            transport.mock_calls[0][1][0]
-            == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\x10*\x01\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x0f5C"
-        )
+    transport.reset_mock()
+    await light.async_config_remotes(RemoteConfig.DISABLED)
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\x10*\x01\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x0f5C"
+    )
 
-        transport.reset_mock()
-        await light.async_config_remotes(RemoteConfig.OPEN)
-        assert transport.mock_calls[0][0] == "write"
-        assert (
-            transport.mock_calls[0][1][0]
-            == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\x10*\x02\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x0f6G"
-        )
+    transport.reset_mock()
+    await light.async_config_remotes(RemoteConfig.OPEN)
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x03\x00\x10*\x02\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x0f6G"
+    )
 
-        transport.reset_mock()
-        await light.async_config_remotes(RemoteConfig.PAIRED_ONLY)
-        assert transport.mock_calls[0][0] == "write"
-        assert (
-            transport.mock_calls[0][1][0]
-            == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x05\x00\x10*\x03\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x0f7K"
-        )
+    transport.reset_mock()
+    await light.async_config_remotes(RemoteConfig.PAIRED_ONLY)
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x05\x00\x10*\x03\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x0f7K"
+    )
 
 
-@pytest.mark.asyncio
-async def test_async_unpair_remotes(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_async_unpair_remotes(mock_aio_protocol, no_device_config_wait):
     """Test we can unpair remotes."""
     light = AIOWifiLedBulb("192.168.1.166")
     light.discovery = FLUX_DISCOVERY_24G_REMOTE
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    with patch.object(aiodevice, "DEVICE_CONFIG_WAIT_SECONDS", 0):
-        task = asyncio.create_task(light.async_setup(_updated_callback))
-        transport, protocol = await mock_aio_protocol()
-        light._aio_protocol.data_received(
-            b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-        )
-        light._aio_protocol.data_received(
-            b"\xb0\xb1\xb2\xb3\x00\x01\x01\x5e\x00\x0e\x2b\x01\x00\x00\x00\x00\x29\x00\x00\x00\x00\x00\x00\x55\xde"
-        )
-
-        await task
-        light._aio_protocol.data_received(
-            b"\xb0\xb1\xb2\xb3\x00\x01\x01\xe3\x00\x0e\x2b\x03\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x19"
-        )
-        assert light.remote_config == RemoteConfig.PAIRED_ONLY
-        assert light.paired_remotes == 2
+    task = asyncio.create_task(light.async_setup(_noop_callback))
+    transport, protocol = await mock_aio_protocol()
+    light._aio_protocol.data_received(STATE_0X25_ON + REMOTE_CONFIG_DISABLED)
+    await task
+    light._aio_protocol.data_received(REMOTE_CONFIG_PAIRED_ONLY)
+    assert light.remote_config == RemoteConfig.PAIRED_ONLY
+    assert light.paired_remotes == 2
 
-        transport.reset_mock()
-        await light.async_unpair_remotes()
-        assert transport.mock_calls[0][0] == "write"
-        assert (
-            transport.mock_calls[0][1][0]
-            == b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\x10*\xff\xff\x01\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\xf0\x16\x05"
-        )
+    transport.reset_mock()
+    await light.async_unpair_remotes()
+    assert transport.mock_calls[0] == call.write(
+        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x01\x00\x10*\xff\xff\x01\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\xf0\x16\x05"
+    )
 
 
-@pytest.mark.asyncio
-async def test_async_config_remotes_unsupported_device(
-    mock_aio_protocol, caplog: pytest.LogCaptureFixture
-):
+async def test_async_config_remotes_unsupported_device(ready_light):
     """Test we can configure remotes."""
-    light = AIOWifiLedBulb("192.168.1.166")
-
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
-    transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    await task
+    light, transport, protocol = ready_light
     assert light.paired_remotes is None
 
     with pytest.raises(ValueError):
@@ -3279,7 +2548,6 @@ async def test_async_config_remotes_unsupported_device(
         await light.async_unpair_remotes()
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(sys.version_info[:3][1] in (7,), reason="no AsyncMock in 3.7")
 async def test_async_config_remotes_no_response(
     mock_aio_protocol, caplog: pytest.LogCaptureFixture
@@ -3288,41 +2556,26 @@ async def test_async_config_remotes_no_response(
     light = AIOWifiLedBulb("192.168.1.166", timeout=0.0001)
     light.discovery = FLUX_DISCOVERY_24G_REMOTE
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
+    light._aio_protocol.data_received(STATE_0X25_ON)
     await task
     assert light.paired_remotes is None
     assert "Could not determine 2.4ghz remote config" in caplog.text
 
 
-@pytest.mark.asyncio
-async def test_partial_discovery(mock_aio_protocol, caplog: pytest.LogCaptureFixture):
+async def test_partial_discovery(mock_aio_protocol):
     """Test discovery that is missing hardware data."""
     light = AIOWifiLedBulb("192.168.1.166")
     light.discovery = FLUX_DISCOVERY_MISSING_HARDWARE
 
-    def _updated_callback(*args, **kwargs):
-        pass
-
-    task = asyncio.create_task(light.async_setup(_updated_callback))
+    task = asyncio.create_task(light.async_setup(_noop_callback))
     transport, protocol = await mock_aio_protocol()
-    light._aio_protocol.data_received(
-        b"\x81\x25\x23\x61\x05\x10\xb6\x00\x98\x19\x04\x25\x0f\xde"
-    )
-    light._aio_protocol.data_received(
-        b"\xb0\xb1\xb2\xb3\x00\x01\x01\x5e\x00\x0e\x2b\x01\x00\x00\x00\x00\x29\x00\x00\x00\x00\x00\x00\x55\xde"
-    )
+    light._aio_protocol.data_received(STATE_0X25_ON + REMOTE_CONFIG_DISABLED)
     await task
     assert light.hardware is None
 
 
-@pytest.mark.asyncio
 async def test_async_scanner(mock_discovery_aio_protocol):
     """Test scanner."""
     scanner = AIOBulbScanner()
@@ -3331,70 +2584,35 @@ async def test_async_scanner(mock_discovery_aio_protocol):
         scanner.async_scan(timeout=0.1, address="192.168.213.252")
     )
     transport, protocol = await mock_discovery_aio_protocol()
-    protocol.datagram_received(b"HF-A11ASSISTHREAD", ("127.0.0.1", 48899))
-    protocol.datagram_received(
-        b"192.168.1.193,DC4F22E6462E,AK001-ZJ200", ("192.168.1.193", 48899)
-    )
-    protocol.datagram_received(
-        b"+ok=25_18_20170908_Armacost\r", ("192.168.1.193", 48899)
-    )
-    protocol.datagram_received(
-        b"+ok=TCP,8806,mhc8806us.magichue.net\r", ("192.168.1.193", 48899)
-    )
-
-    protocol.datagram_received(
-        b"192.168.213.252,B4E842E10588,AK001-ZJ2145", ("192.168.213.252", 48899)
-    )
-    protocol.datagram_received(
-        b"192.168.198.198,B4E842E10522,AK001-ZJ2149", ("192.168.198.198", 48899)
-    )
-    protocol.datagram_received(
-        b"192.168.198.197,B4E842E10521,AK001-ZJ2146", ("192.168.198.197", 48899)
-    )
-    protocol.datagram_received(
-        b"192.168.198.196,B4E842E10520,AK001-ZJ2144", ("192.168.198.196", 48899)
-    )
-    protocol.datagram_received(
-        b"192.168.211.230,A020A61D892B,AK001-ZJ100", ("192.168.211.230", 48899)
-    )
-    protocol.datagram_received(
-        b"+ok=TCP,GARBAGE,ra8816us02.magichue.net\r", ("192.168.213.252", 48899)
-    )
-    protocol.datagram_received(
-        b"192.168.213.259,B4E842E10586,AK001-ZJ2145", ("192.168.213.259", 48899)
-    )
-    protocol.datagram_received(
-        b"+ok=TCP,8816,ra8816us02.magichue.net\r", ("192.168.213.252", 48899)
-    )
-    protocol.datagram_received(
-        b"+ok=TCP,8806,mhc8806us.magichue.net", ("192.168.211.230", 48899)
-    )
-    protocol.datagram_received(b"AT+LVER\r", ("127.0.0.1", 48899))
-    protocol.datagram_received(
-        b"+ok=GARBAGE_GARBAGE_GARBAGE_ZG-BL\r", ("192.168.213.252", 48899)
-    )
-    protocol.datagram_received(
-        b"+ok=08_15_20210204_ZG-BL\r", ("192.168.213.252", 48899)
-    )
-    protocol.datagram_received(b"+ok=52_3_20210204\r", ("192.168.198.198", 48899))
-    protocol.datagram_received(b"+ok=62_3\r", ("192.168.198.197", 48899))
-    protocol.datagram_received(b"+ok=41_3_202\r", ("192.168.198.196", 48899))
-
-    protocol.datagram_received(
-        b"+ok=35_62_20210109_ZG-BL-PWM\r", ("192.168.213.259", 48899)
-    )
-    protocol.datagram_received(
-        b"192.168.213.65,F4CFA23E1AAF,AK001-ZJ2104", ("192.168.213.65", 48899)
-    )
-    protocol.datagram_received(
-        b"+ok=33_11_20170307_IR_mini\r\n", ("192.168.211.230", 48899)
-    )
-    protocol.datagram_received(b"+ok=", ("192.168.213.65", 48899))
-    protocol.datagram_received(b"+ok=A2_33_20200428_ZG-LX\r", ("192.168.213.65", 48899))
-    protocol.datagram_received(b"+ok=", ("192.168.213.259", 48899))
-    protocol.datagram_received(
-        b"+ok=TCP,8816,ra8816us02.magichue.net\r", ("192.168.198.196", 48899)
-    )
+    for payload, addr in (
+        (b"HF-A11ASSISTHREAD", ("127.0.0.1", 48899)),
+        (b"192.168.1.193,DC4F22E6462E,AK001-ZJ200", ("192.168.1.193", 48899)),
+        (b"+ok=25_18_20170908_Armacost\r", ("192.168.1.193", 48899)),
+        (b"+ok=TCP,8806,mhc8806us.magichue.net\r", ("192.168.1.193", 48899)),
+        (SCAN_RESPONSE_MIC, ("192.168.213.252", 48899)),
+        (b"192.168.198.198,B4E842E10522,AK001-ZJ2149", ("192.168.198.198", 48899)),
+        (b"192.168.198.197,B4E842E10521,AK001-ZJ2146", ("192.168.198.197", 48899)),
+        (b"192.168.198.196,B4E842E10520,AK001-ZJ2144", ("192.168.198.196", 48899)),
+        (b"192.168.211.230,A020A61D892B,AK001-ZJ100", ("192.168.211.230", 48899)),
+        (b"+ok=TCP,GARBAGE,ra8816us02.magichue.net\r", ("192.168.213.252", 48899)),
+        (b"192.168.213.259,B4E842E10586,AK001-ZJ2145", ("192.168.213.259", 48899)),
+        (REMOTE_ACCESS_RESPONSE, ("192.168.213.252", 48899)),
+        (b"+ok=TCP,8806,mhc8806us.magichue.net", ("192.168.211.230", 48899)),
+        (b"AT+LVER\r", ("127.0.0.1", 48899)),
+        (b"+ok=GARBAGE_GARBAGE_GARBAGE_ZG-BL\r", ("192.168.213.252", 48899)),
+        (VERSION_RESPONSE_MIC, ("192.168.213.252", 48899)),
+        (b"+ok=52_3_20210204\r", ("192.168.198.198", 48899)),
+        (b"+ok=62_3\r", ("192.168.198.197", 48899)),
+        (b"+ok=41_3_202\r", ("192.168.198.196", 48899)),
+        (b"+ok=35_62_20210109_ZG-BL-PWM\r", ("192.168.213.259", 48899)),
+        (b"192.168.213.65,F4CFA23E1AAF,AK001-ZJ2104", ("192.168.213.65", 48899)),
+        (b"+ok=33_11_20170307_IR_mini\r\n", ("192.168.211.230", 48899)),
+        (b"+ok=", ("192.168.213.65", 48899)),
+        (b"+ok=A2_33_20200428_ZG-LX\r", ("192.168.213.65", 48899)),
+        (b"+ok=", ("192.168.213.259", 48899)),
+        (REMOTE_ACCESS_RESPONSE, ("192.168.198.196", 48899)),
+    ):
+        protocol.datagram_received(payload, addr)
     data = await task
     assert data == [
         {
@@ -3410,19 +2628,7 @@ async def test_async_scanner(mock_discovery_aio_protocol):
             "remote_access_port": 8806,
             "version_num": 24,
         },
-        {
-            "firmware_date": datetime.date(2021, 2, 4),
-            "id": "B4E842E10588",
-            "ipaddr": "192.168.213.252",
-            "model": "AK001-ZJ2145",
-            "model_description": "Controller RGB with MIC",
-            "model_info": "ZG-BL",
-            "model_num": 8,
-            "remote_access_enabled": True,
-            "remote_access_host": "ra8816us02.magichue.net",
-            "remote_access_port": 8816,
-            "version_num": 21,
-        },
+        FLUX_DISCOVERY_MIC,
         {
             "firmware_date": datetime.date(2021, 2, 4),
             "id": "B4E842E10522",
@@ -3504,7 +2710,6 @@ async def test_async_scanner(mock_discovery_aio_protocol):
     ]
 
 
-@pytest.mark.asyncio
 async def test_async_scanner_specific_address(mock_discovery_aio_protocol):
     """Test scanner with a specific address."""
     scanner = AIOBulbScanner()
@@ -3513,62 +2718,15 @@ async def test_async_scanner_specific_address(mock_discovery_aio_protocol):
         scanner.async_scan(timeout=10, address="192.168.213.252")
     )
     transport, protocol = await mock_discovery_aio_protocol()
-    protocol.datagram_received(
-        b"192.168.213.252,B4E842E10588,AK001-ZJ2145", ("192.168.213.252", 48899)
-    )
-    protocol.datagram_received(
-        b"+ok=08_15_20210204_ZG-BL\r", ("192.168.213.252", 48899)
-    )
-    protocol.datagram_received(
-        b"+ok=TCP,8816,ra8816us02.magichue.net\r", ("192.168.213.252", 48899)
-    )
+    protocol.datagram_received(SCAN_RESPONSE_MIC, ("192.168.213.252", 48899))
+    protocol.datagram_received(VERSION_RESPONSE_MIC, ("192.168.213.252", 48899))
+    protocol.datagram_received(REMOTE_ACCESS_RESPONSE, ("192.168.213.252", 48899))
     data = await task
-    assert data == [
-        {
-            "firmware_date": datetime.date(2021, 2, 4),
-            "id": "B4E842E10588",
-            "ipaddr": "192.168.213.252",
-            "model": "AK001-ZJ2145",
-            "model_description": "Controller RGB with MIC",
-            "model_info": "ZG-BL",
-            "model_num": 8,
-            "version_num": 21,
-            "remote_access_enabled": True,
-            "remote_access_host": "ra8816us02.magichue.net",
-            "remote_access_port": 8816,
-        }
-    ]
-    assert scanner.getBulbInfoByID("B4E842E10588") == {
-        "firmware_date": datetime.date(2021, 2, 4),
-        "id": "B4E842E10588",
-        "ipaddr": "192.168.213.252",
-        "model": "AK001-ZJ2145",
-        "model_description": "Controller RGB with MIC",
-        "model_info": "ZG-BL",
-        "model_num": 8,
-        "version_num": 21,
-        "remote_access_enabled": True,
-        "remote_access_host": "ra8816us02.magichue.net",
-        "remote_access_port": 8816,
-    }
-    assert scanner.getBulbInfo() == [
-        {
-            "firmware_date": datetime.date(2021, 2, 4),
-            "id": "B4E842E10588",
-            "ipaddr": "192.168.213.252",
-            "model": "AK001-ZJ2145",
-            "model_description": "Controller RGB with MIC",
-            "model_info": "ZG-BL",
-            "model_num": 8,
-            "version_num": 21,
-            "remote_access_enabled": True,
-            "remote_access_host": "ra8816us02.magichue.net",
-            "remote_access_port": 8816,
-        }
-    ]
+    assert data == [FLUX_DISCOVERY_MIC]
+    assert scanner.getBulbInfoByID("B4E842E10588") == FLUX_DISCOVERY_MIC
+    assert scanner.getBulbInfo() == [FLUX_DISCOVERY_MIC]
 
 
-@pytest.mark.asyncio
 async def test_async_scanner_specific_address_legacy_device(
     mock_discovery_aio_protocol,
 ):
@@ -3603,33 +2761,20 @@ async def test_async_scanner_specific_address_legacy_device(
     assert is_legacy_device(data[0]) is True
 
 
-@pytest.mark.asyncio
-async def test_async_scanner_times_out_with_nothing(mock_discovery_aio_protocol):
-    """Test scanner."""
-    scanner = AIOBulbScanner()
-
-    task = asyncio.ensure_future(scanner.async_scan(timeout=0.025))
-    transport, protocol = await mock_discovery_aio_protocol()
-    data = await task
-    assert data == []
-
-
-@pytest.mark.asyncio
-async def test_async_scanner_times_out_with_nothing_specific_address(
-    mock_discovery_aio_protocol,
+@pytest.mark.parametrize("address", [None, "192.168.213.252"])
+async def test_async_scanner_times_out_with_nothing(
+    mock_discovery_aio_protocol, address
 ):
-    """Test scanner."""
+    """Test scanner times out when nothing responds."""
     scanner = AIOBulbScanner()
 
-    task = asyncio.ensure_future(
-        scanner.async_scan(timeout=0.025, address="192.168.213.252")
-    )
+    task = asyncio.ensure_future(scanner.async_scan(timeout=0, address=address))
     transport, protocol = await mock_discovery_aio_protocol()
     data = await task
     assert data == []
+    assert transport.mock_calls[-1] == call.close()
 
 
-@pytest.mark.asyncio
 async def test_async_scanner_falls_back_to_any_source_port_if_socket_in_use():
     """Test port fallback."""
     hold_socket = create_udp_socket(AIOBulbScanner.DISCOVERY_PORT)
@@ -3638,7 +2783,6 @@ async def test_async_scanner_falls_back_to_any_source_port_if_socket_in_use():
     assert random_socket.getsockname() != ("0.0.0.0", 48899)
 
 
-@pytest.mark.asyncio
 async def test_async_scanner_enable_remote_access(mock_discovery_aio_protocol):
     """Test scanner enabling remote access with a specific address."""
     scanner = AIOBulbScanner()
@@ -3652,9 +2796,7 @@ async def test_async_scanner_enable_remote_access(mock_discovery_aio_protocol):
         )
     )
     transport, protocol = await mock_discovery_aio_protocol()
-    protocol.datagram_received(
-        b"192.168.213.252,B4E842E10588,AK001-ZJ2145", ("192.168.213.252", 48899)
-    )
+    protocol.datagram_received(SCAN_RESPONSE_MIC, ("192.168.213.252", 48899))
     protocol.datagram_received(b"+ok\r", ("192.168.213.252", 48899))
     protocol.datagram_received(b"+ok\r", ("192.168.213.252", 48899))
     await task
@@ -3668,7 +2810,6 @@ async def test_async_scanner_enable_remote_access(mock_discovery_aio_protocol):
     ]
 
 
-@pytest.mark.asyncio
 async def test_async_scanner_disable_remote_access(mock_discovery_aio_protocol):
     """Test scanner disable remote access with a specific address."""
     scanner = AIOBulbScanner()
@@ -3680,9 +2821,7 @@ async def test_async_scanner_disable_remote_access(mock_discovery_aio_protocol):
         )
     )
     transport, protocol = await mock_discovery_aio_protocol()
-    protocol.datagram_received(
-        b"192.168.213.252,B4E842E10588,AK001-ZJ2145", ("192.168.213.252", 48899)
-    )
+    protocol.datagram_received(SCAN_RESPONSE_MIC, ("192.168.213.252", 48899))
     protocol.datagram_received(b"+ok\r", ("192.168.213.252", 48899))
     protocol.datagram_received(b"+ok\r", ("192.168.213.252", 48899))
     await task
@@ -3694,7 +2833,6 @@ async def test_async_scanner_disable_remote_access(mock_discovery_aio_protocol):
     ]
 
 
-@pytest.mark.asyncio
 async def test_async_scanner_reboot(mock_discovery_aio_protocol):
     """Test scanner reboot with a specific address."""
     scanner = AIOBulbScanner()
@@ -3706,9 +2844,7 @@ async def test_async_scanner_reboot(mock_discovery_aio_protocol):
         )
     )
     transport, protocol = await mock_discovery_aio_protocol()
-    protocol.datagram_received(
-        b"192.168.213.252,B4E842E10588,AK001-ZJ2145", ("192.168.213.252", 48899)
-    )
+    protocol.datagram_received(SCAN_RESPONSE_MIC, ("192.168.213.252", 48899))
     protocol.datagram_received(b"+ok\r", ("192.168.213.252", 48899))
     await task
     assert transport.mock_calls == [
@@ -3718,7 +2854,6 @@ async def test_async_scanner_reboot(mock_discovery_aio_protocol):
     ]
 
 
-@pytest.mark.asyncio
 async def test_async_scanner_disable_remote_access_timeout(mock_discovery_aio_protocol):
     """Test scanner disable remote access with a specific address failure."""
     scanner = AIOBulbScanner()
@@ -3729,9 +2864,7 @@ async def test_async_scanner_disable_remote_access_timeout(mock_discovery_aio_pr
         )
     )
     transport, protocol = await mock_discovery_aio_protocol()
-    protocol.datagram_received(
-        b"192.168.213.252,B4E842E10588,AK001-ZJ2145", ("192.168.213.252", 48899)
-    )
+    protocol.datagram_received(SCAN_RESPONSE_MIC, ("192.168.213.252", 48899))
     protocol.datagram_received(b"+ok\r", ("192.168.213.252", 48899))
     with pytest.raises(asyncio.TimeoutError):
         await task
@@ -3757,7 +2890,6 @@ def test_merge_discoveries() -> None:
     assert full == FLUX_DISCOVERY
 
 
-@pytest.mark.asyncio
 async def test_armacost():
     """Test armacost uses port 34001."""
     discovery = FluxLEDDiscovery(
@@ -3780,24 +2912,8 @@ async def test_armacost():
     assert light.port == 34001
 
 
-@pytest.mark.asyncio
 async def test_not_armacost():
     """Test not armacost uses 5577."""
-    discovery = FluxLEDDiscovery(
-        {
-            "firmware_date": datetime.date(2021, 2, 4),
-            "id": "B4E842E10588",
-            "ipaddr": "192.168.213.252",
-            "model": "AK001-ZJ2145",
-            "model_description": "Controller RGB with MIC",
-            "model_info": "ZG-BL",
-            "model_num": 8,
-            "remote_access_enabled": True,
-            "remote_access_host": "ra8816us02.magichue.net",
-            "remote_access_port": 8816,
-            "version_num": 21,
-        }
-    )
     light = AIOWifiLedBulb("192.168.213.252")
-    light.discovery = discovery
+    light.discovery = FLUX_DISCOVERY_MIC
     assert light.port == 5577